@@ -1,4 +1,5 @@
 from .api import API
+from .executors import Executor
 from .static import static
 from .middleware import Middleware
 from .media import Media
@@ -1,7 +1,8 @@
 """The Bocadillo API class."""
 import os
 from functools import partial
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, Callable
+from http import HTTPStatus
+from typing import Dict, List, Optional, Type, Union, Callable
 
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
@@ -12,22 +13,47 @@ from starlette.testclient import TestClient
 from uvicorn.main import get_logger, run
 from uvicorn.reloaders.statreload import StatReload
 
+from .caching import ResponseCache, ResponseCacheInfo
 from .cors import DEFAULT_CORS_CONFIG
-from .error_handlers import ErrorHandler, convert_exception_to_response
+from .error_handlers import (
+    ErrorHandler,
+    convert_exception_to_response,
+    error_to_text,
+)
 from .events import EventsMixin
 from .exceptions import HTTPError
+from .executors import (
+    AdaptiveExecutor,
+    AnyExecutor,
+    Executor,
+    InlineExecutor,
+    Placement,
+)
+from .files import ZEROCOPY_EXTENSION
 from .hooks import HooksMixin
 from .media import Media
 from .meta import APIMeta
+from .middleware import Dispatcher
+from .mounts import MountTree
 from .recipes import RecipeBase
 from .redirection import Redirection
 from .request import Request
 from .response import Response
-from .routing import RoutingMixin
+from .routing import Route, RoutingMixin
+from .singleflight import SingleFlight
 from .static import static
 from .templates import TemplatesMixin
 from .types import ASGIApp, ASGIAppInstance, WSGIApp
 
+# ASGI middleware known to pass response body messages through untouched,
+# which makes the zero-copy send extension and range requests safe to use
+# behind them.
+_BODY_PRESERVING_MIDDLEWARE = (
+    TrustedHostMiddleware,
+    CORSMiddleware,
+    HTTPSRedirectMiddleware,
+)
+
 
 class API(
     TemplatesMixin, RoutingMixin, HooksMixin, EventsMixin, metaclass=APIMeta
@@ -87,9 +113,65 @@ class API(
         Can be one of the supported media types.
         Defaults to `"application/json"`.
         See also [Media](../topics/request-handling/media.md).
+    json_backend (str):
+        The library used to serialize JSON media: one of `"json"`
+        (the standard library), `"orjson"`, `"ujson"` or `"rapidjson"`.
+        If `None`, the fastest one that is installed is used.
+        Defaults to `"json"`.
+        See also [Media](../topics/request-handling/media.md#json-backends).
+    route_cache_size (int):
+        If given, the routes matched by up to this many URL paths are kept
+        in an LRU cache. Disabled by default.
+        See also [Routes and URL design](../topics/request-handling/routes-url-design.md#caching-route-matches).
+    route_not_found_cache_size (int):
+        The maximum number of URL paths that did not match any route to keep
+        in the route cache. Only used if `route_cache_size` is given.
+        Defaults to `route_cache_size`.
+    routing_engine (str):
+        How routes with parameters are matched against URL paths.
+        Either `"tree"` or `"regex"`. Defaults to `"tree"`.
+        See also [Routes and URL design](../topics/request-handling/routes-url-design.md#routing-engines).
+    enable_conditional (bool):
+        If `True`, answer `GET` and `HEAD` requests with a
+        `304 Not Modified` response when the client's cached copy is fresh,
+        generating an `ETag` out of the response body if needed.
+        Can be overridden per route. Defaults to `False`.
+        See also [Responses](../topics/request-handling/responses.md#conditional-responses).
+    response_cache_max_bytes (int):
+        The maximum total size of the responses cached for routes
+        declared with a `cache_ttl`, in bytes.
+        Defaults to 16 MiB.
+        See also [Responses](../topics/request-handling/responses.md#caching-responses).
+    single_flight_timeout (float):
+        How long requests to routes declared with `single_flight=True`
+        wait for the response to an identical in-flight request,
+        in seconds, before computing their own response.
+        Defaults to `10`.
+        See also [Responses](../topics/request-handling/responses.md#coalescing-identical-requests).
+    executor (Executor):
+        The pool of threads in which synchronous views, hooks and
+        middleware callbacks are run. Routes can use their own.
+        Defaults to an `Executor()` with default settings.
+        See also [Views](../topics/features/views.md#executors).
+    inline_watchdog (float):
+        If given, a warning is logged when a synchronous view or hook
+        of a route declared with `inline=True` blocks the event loop
+        for longer than this many seconds. Meant for development.
+        Defaults to `None` (disabled).
+        See also [Views](../topics/features/views.md#inline-views).
+    adaptive_inline (bool):
+        If `True`, the execution time of synchronous views and hooks is
+        measured, and those that consistently return quickly are run
+        on the event loop instead of in a thread. Only applies to
+        routes that don't specify `inline`. Defaults to `False`.
+        See also [Views](../topics/features/views.md#adaptive-inlining).
+    adaptive_inline_threshold (float):
+        The average execution time below which `adaptive_inline`
+        runs synchronous views and hooks on the event loop, in seconds.
+        Defaults to `0.0002` (200 microseconds).
     """
 
-    _error_handlers: List[Tuple[Type[Exception], ErrorHandler]]
+    _error_handlers: Dict[Type[Exception], ErrorHandler]
 
     def __init__(
         self,
@@ -103,12 +185,31 @@ class API(
         enable_gzip: bool = False,
         gzip_min_size: int = 1024,
         media_type: Optional[str] = Media.JSON,
+        json_backend: Optional[str] = "json",
+        route_cache_size: int = None,
+        route_not_found_cache_size: int = None,
+        routing_engine: str = "tree",
+        enable_conditional: bool = False,
+        response_cache_max_bytes: int = 16 * 1024 * 1024,
+        single_flight_timeout: float = 10,
+        executor: Executor = None,
+        inline_watchdog: float = None,
+        adaptive_inline: bool = False,
+        adaptive_inline_threshold: float = 0.0002,
     ):
-        super().__init__(templates_dir=templates_dir)
+        super().__init__(
+            templates_dir=templates_dir,
+            route_cache_size=route_cache_size,
+            route_not_found_cache_size=route_not_found_cache_size,
+            routing_engine=routing_engine,
+        )
 
-        self._error_handlers = []
+        self._error_handlers = {}
+        self._error_handlers_cache: Dict[
+            Type[Exception], Optional[ErrorHandler]
+        ] = {}
 
-        self._extra_apps: Dict[str, Any] = {}
+        self._mounts = MountTree()
 
         self.client = self._build_client()
 
@@ -117,10 +218,24 @@ class API(
                 static_root = static_dir
             self.mount(static_root, static(static_dir))
 
-        self._media = Media(media_type=media_type)
+        self._media = Media(media_type=media_type, json_backend=json_backend)
+        self._conditional = enable_conditional
+        self._response_cache = ResponseCache(max_size=response_cache_max_bytes)
+        self._single_flight = SingleFlight(timeout=single_flight_timeout)
+        if executor is None:
+            executor = Executor()
+        self._executor = executor
+        self._inline_executor = InlineExecutor(watchdog=inline_watchdog)
+        self._adaptive_inline = adaptive_inline
+        self._adaptive_inline_threshold = adaptive_inline_threshold
+        # Executor of each route, resolved on the first request.
+        self._route_executors: Dict[Route, AnyExecutor] = {}
 
         self._middleware = []
+        self._dispatch_chain: Optional[Dispatcher] = None
         self._asgi_middleware = []
+        self._asgi_app: Optional[ASGIApp] = None
+        self._body_preserved = True
 
         if allowed_hosts is None:
             allowed_hosts = ["*"]
@@ -149,13 +264,17 @@ class API(
     def mount(self, prefix: str, app: Union[ASGIApp, WSGIApp]):
         """Mount another WSGI or ASGI app at the given prefix.
 
+        Requests whose path starts with the segments of `prefix`
+        are forwarded to the app. If several apps match, the one mounted
+        at the longest prefix is used.
+
         # Parameters
         prefix (str): A path prefix where the app should be mounted, e.g. `"/myapp"`.
         app: An object implementing [WSGI](https://wsgi.readthedocs.io) or [ASGI](https://asgi.readthedocs.io) protocol.
         """
         if not prefix.startswith("/"):
             prefix = "/" + prefix
-        self._extra_apps[prefix] = app
+        self._mounts.add(prefix, app)
 
     def recipe(self, recipe: RecipeBase):
         recipe.apply(self)
@@ -173,6 +292,14 @@ class API(
     def media_type(self, media_type: str):
         self._media.type = media_type
 
+    @property
+    def executor(self) -> Executor:
+        """The executor of synchronous views, hooks and middleware callbacks.
+
+        Use `api.executor.metrics()` to monitor it.
+        """
+        return self._executor
+
     @property
     def media_handlers(self) -> dict:
         """The dictionary of supported media handlers.
@@ -197,8 +324,15 @@ class API(
             The actual error handler, which is called when an instance of
             `exception_cls` is caught.
             Should accept a `req`, a `res` and an `exc`.
+
+        If handlers are registered for several base classes of an exception,
+        the one registered for the closest base class is used.
+        Registering a handler for an exception class that already has one
+        replaces it.
         """
-        self._error_handlers.insert(0, (exception_cls, handler))
+        self._error_handlers[exception_cls] = handler
+        self._error_handlers_cache.clear()
+        self._dispatch_chain = None
 
     def error_handler(self, exception_cls: Type[Exception]):
         """Register a new error handler (decorator syntax).
@@ -222,10 +356,19 @@ class API(
     def _find_handler(
         self, exception_cls: Type[Exception]
     ) -> Optional[ErrorHandler]:
-        for cls, handler in self._error_handlers:
-            if issubclass(exception_cls, cls):
-                return handler
-        return None
+        # The handler of the closest class in the exception's MRO wins.
+        # Resolutions are cached until a new handler is registered.
+        try:
+            return self._error_handlers_cache[exception_cls]
+        except KeyError:
+            pass
+        handler = None
+        for cls in exception_cls.__mro__:
+            if cls in self._error_handlers:
+                handler = self._error_handlers[cls]
+                break
+        self._error_handlers_cache[exception_cls] = handler
+        return handler
 
     def _handle_exception(
         self, req: Request, res: Response, exception: Exception
@@ -281,6 +424,7 @@ class API(
             A subclass of #~some.middleware.Middleware.
         """
         self._middleware.insert(0, (middleware_cls, kwargs))
+        self._dispatch_chain = None
 
     def add_asgi_middleware(self, middleware_cls, *args, **kwargs):
         """Register an ASGI middleware class.
@@ -291,6 +435,8 @@ class API(
             A class that conforms to ASGI standard.
         """
         self._asgi_middleware.insert(0, (middleware_cls, args, kwargs))
+        # The middleware stack is built once, on the next request.
+        self._asgi_app = None
 
     async def dispatch(self, req: Request) -> Response:
         """Dispatch a req and return a response.
@@ -306,6 +452,7 @@ class API(
         """
 
         res = Response(req, media=self._media)
+        res.byte_ranges = self._body_preserved
 
         try:
             match = self._router.match(req.url.path)
@@ -313,20 +460,112 @@ class API(
                 raise HTTPError(status=404)
 
             route, params = match.route, match.params
-            route.raise_for_method(req)
-
-            try:
-                hooks = self.get_hooks().on(route, req, res, params)
-                async with hooks:
-                    await route(req, res, **params)
-            except Redirection as redirection:
-                res = redirection.response
+            if req.method not in route.methods:
+                return self._method_not_allowed(req, res, route)
+
+            if route.conditional is None:
+                res.conditional = self._conditional
+            else:
+                res.conditional = route.conditional
+
+            executor = self._route_executors.get(route)
+            if executor is None:
+                executor = self._get_executor(route)
+                self._route_executors[route] = executor
+            res.executor = executor
+
+            # Cached responses are sent without calling hooks or the view.
+            cache = self._response_cache
+            cache_key = None
+            if route.cache_ttl is not None and cache.is_cacheable_request(req):
+                cache_key = cache.base_key(req, route.name, params)
+                cached = cache.get(req, cache_key)
+                if cached is not None:
+                    cached.apply(res)
+                    return res
+
+            if route.single_flight and req.method == "GET":
+                key = self._single_flight.key(req, route.name, params)
+                call = partial(self._call_route, route=route, params=params)
+                res = await self._single_flight.run(key, req, res, call)
+            else:
+                res = await self._call_route(req, res, route, params)
+
+            if cache_key is not None and isinstance(res, Response):
+                cache.store(req, cache_key, res, ttl=route.cache_ttl)
 
         except Exception as e:
             self._handle_exception(req, res, e)
 
         return res
 
+    async def _call_route(
+        self, req: Request, res: Response, route: Route, params: dict
+    ) -> Response:
+        chain = self.get_hooks().get_chain(route)
+        try:
+            if chain is None:
+                await route(req, res, **params)
+            else:
+                await chain(req, res, params)
+        except Redirection as redirection:
+            return redirection.response
+        return res
+
+    def _get_executor(self, route: Route) -> AnyExecutor:
+        if route.inline:
+            return self._inline_executor
+        executor = route.executor
+        if executor is None:
+            executor = self._executor
+        if route.inline is None and self._adaptive_inline:
+            return AdaptiveExecutor(
+                executor, threshold=self._adaptive_inline_threshold
+            )
+        return executor
+
+    def sync_placements(self) -> Dict[str, List[Placement]]:
+        """Return where synchronous views and hooks are run.
+
+        Only routes that use `adaptive_inline` and have been requested
+        are listed.
+
+        # Returns
+        placements (dict):
+            A dictionary mapping route names to lists of `Placement`
+            named tuples, one per synchronous view or hook function,
+            which tell whether it is currently run inline, its rolling
+            average execution time in seconds, and its number of calls.
+        """
+        return {
+            route.name: executor.placements()
+            for route, executor in self._route_executors.items()
+            if isinstance(executor, AdaptiveExecutor)
+        }
+
+    def response_cache_info(self) -> ResponseCacheInfo:
+        """Return statistics about the response cache.
+
+        # Returns
+        info (ResponseCacheInfo):
+            A named tuple of hits, misses, and the current and maximum
+            size of the cache in bytes.
+        """
+        return self._response_cache.info()
+
+    def _method_not_allowed(
+        self, req: Request, res: Response, route: Route
+    ) -> Response:
+        # Build the 405 response directly instead of raising an `HTTPError`
+        # and going through the exception handling machinery.
+        error_handler = self._find_handler(HTTPError) or error_to_text
+        error_handler(req, res, HTTPError(HTTPStatus.METHOD_NOT_ALLOWED))
+        # Same default as for errors handled in `_handle_exception()`.
+        if res.status_code is None:
+            res.status_code = 500
+        res.headers["allow"] = route.allow
+        return res
+
     def find_app(self, scope: dict) -> ASGIAppInstance:
         """Return the ASGI application suited to the given ASGI scope.
 
@@ -347,30 +586,47 @@ class API(
         path: str = scope["path"]
 
         # Return a sub-mounted extra app, if found
-        for prefix, app in self._extra_apps.items():
-            if not path.startswith(prefix):
-                continue
+        mounted = self._mounts.find(path)
+        if mounted is not None:
+            app, prefix = mounted
             # Remove prefix from path so that the request is made according
-            # to the mounted app's point of view.
-            scope["path"] = path[len(prefix) :]
+            # to the mounted app's point of view. A request for the prefix
+            # itself is seen as a request for the mounted app's root.
+            scope["path"] = path[len(prefix) :] or "/"
             try:
                 return app(scope)
             except TypeError:
                 return WSGIResponder(app, scope)
 
-        def app(s: dict):
-            async def asgi(receive, send):
-                nonlocal s
-                req = Request(s, receive)
-                res = await self._get_response(req)
-                await res(receive, send)
-
-            return asgi
-
-        app = self._asgi_middleware_chain(app)
-        return app(scope)
-
-    async def _get_response(self, req: Request) -> Response:
+        if self._asgi_app is None:
+            self._asgi_app = self._asgi_middleware_chain(self._http_app)
+            # Middleware transforming response bodies (e.g. GZip) would not
+            # see files sent through the zero-copy extension, and would
+            # make the offsets of byte ranges meaningless.
+            self._body_preserved = all(
+                issubclass(cls, _BODY_PRESERVING_MIDDLEWARE)
+                for cls, _, _ in self._asgi_middleware
+            )
+        return self._asgi_app(scope)
+
+    def _http_app(self, scope: dict) -> ASGIAppInstance:
+        if not self._body_preserved:
+            extensions = scope.get("extensions")
+            if extensions and ZEROCOPY_EXTENSION in extensions:
+                scope["extensions"] = {
+                    name: value
+                    for name, value in extensions.items()
+                    if name != ZEROCOPY_EXTENSION
+                }
+
+        async def asgi(receive, send):
+            req = Request(scope, receive)
+            res = await self._get_response(req)
+            await res(receive, send)
+
+        return asgi
+
+    def _build_dispatch_chain(self) -> Dispatcher:
         error_handler = self._find_handler(HTTPError)
         convert = partial(
             convert_exception_to_response,
@@ -380,8 +636,16 @@ class API(
         dispatch = convert(self.dispatch)
         for cls, kwargs in self._middleware:
             middleware = cls(dispatch, **kwargs)
+            middleware.executor = self._executor
             dispatch = convert(middleware)
-        return await dispatch(req)
+        return dispatch
+
+    async def _get_response(self, req: Request) -> Response:
+        # The dispatch chain is built once, on the first request after
+        # middleware or error handlers have changed.
+        if self._dispatch_chain is None:
+            self._dispatch_chain = self._build_dispatch_chain()
+        return await self._dispatch_chain(req)
 
     def _asgi_middleware_chain(self, app: ASGIApp) -> ASGIApp:
         for middleware_cls, args, kwargs in self._asgi_middleware:
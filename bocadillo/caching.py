@@ -0,0 +1,231 @@
+"""In-process caching of responses."""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from .conditional import make_etag
+from .headers import Headers
+from .request import Request
+from .response import Response
+
+# Directives that prevent a response from being stored in a shared cache.
+_NO_STORE_DIRECTIVES = ("no-store", "private", "no-cache")
+
+# Rough size of cached `Vary` header names, used to bound their number.
+_VARY_ENTRY_SIZE = 64
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a `Cache-Control` header into a dict of directives."""
+    directives = {}
+    for directive in value.split(","):
+        name, _, argument = directive.partition("=")
+        name = name.strip().lower()
+        if name:
+            directives[name] = argument.strip().strip('"') or None
+    return directives
+
+
+def _get_max_age(directives: Dict[str, Optional[str]]) -> Optional[float]:
+    for name in ("s-maxage", "max-age"):
+        value = directives.get(name)
+        if value is not None:
+            try:
+                return max(int(value), 0)
+            except ValueError:
+                return 0
+    return None
+
+
+def get_vary(headers: Headers) -> List[str]:
+    """Return the lowercased header names listed in `Vary` headers."""
+    return [
+        name.strip().lower()
+        for value in headers.getlist("vary")
+        for name in value.split(",")
+        if name.strip()
+    ]
+
+
+class ResponseCacheInfo(NamedTuple):
+    """Statistics about a response cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class CachedResponse(NamedTuple):
+    """A response stored in the cache."""
+
+    status_code: int
+    headers: Headers
+    body: bytes
+    expires: float
+
+    def apply(self, res: Response):
+        """Copy the cached response onto a fresh response object."""
+        res.status_code = self.status_code
+        res.headers = self.headers.copy()
+        res.content = self.body
+
+
+class _SizedLRU:
+    """An LRU mapping bounded by the total size of its values."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._items: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        try:
+            value, _ = self._items[key]
+        except KeyError:
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, size: int):
+        self.pop(key)
+        if size > self.max_size:
+            return
+        self._items[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.size -= evicted_size
+
+    def pop(self, key: Hashable):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.size -= item[1]
+
+    def clear(self):
+        self._items.clear()
+        self.size = 0
+
+
+class ResponseCache:
+    """A cache of responses, bounded by their total size in bytes.
+
+    Responses are keyed by route name, route parameters, query string,
+    and the values of the request headers listed in the `Vary` header
+    of the response. The least recently used responses are evicted first.
+
+    Only successful (`200`) responses to `GET` requests are stored, unless
+    their `Cache-Control` header contains `no-store`, `private`
+    or `no-cache`, or they set cookies. The `max-age` (or `s-maxage`)
+    directive overrides the time-to-live given by the route.
+
+    Requests with an `Authorization` header, or whose `Cache-Control`
+    header contains `no-cache` or `no-store`, are never served from
+    the cache.
+
+    # Parameters
+    max_size (int): the maximum total size of cached responses, in bytes.
+    """
+
+    def __init__(self, max_size: int):
+        self._store = _SizedLRU(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def base_key(req: Request, route_name: str, params: dict) -> tuple:
+        return (route_name, tuple(sorted(params.items())), req.url.query)
+
+    @staticmethod
+    def is_cacheable_request(req: Request) -> bool:
+        if req.method != "GET" or "authorization" in req.headers:
+            return False
+        cache_control = req.headers.get("cache-control")
+        if cache_control is not None:
+            directives = parse_cache_control(cache_control)
+            if "no-cache" in directives or "no-store" in directives:
+                return False
+        return True
+
+    def _key(self, req: Request, base_key: tuple) -> Optional[tuple]:
+        vary: Optional[List[str]] = self._store.get(("vary", base_key))
+        if vary is None:
+            return None
+        return (base_key, tuple(req.headers.get(name) for name in vary))
+
+    def get(self, req: Request, base_key: tuple) -> Optional[CachedResponse]:
+        """Return the cached response to a request, if any and fresh."""
+        key = self._key(req, base_key)
+        cached: Optional[CachedResponse] = None
+        if key is not None:
+            cached = self._store.get(key)
+        if cached is not None and cached.expires <= time.monotonic():
+            self._store.pop(key)
+            cached = None
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def store(self, req: Request, base_key: tuple, res: Response, ttl: float):
+        """Store a response, if it can be cached.
+
+        String content is encoded in place, so that it is encoded only once.
+        If the response is conditional, its `ETag` is generated here.
+        """
+        # The status code defaults to 200 when the response is sent.
+        if (
+            res.status_code not in (None, 200)
+            or not isinstance(res.content, (str, bytes))
+            or "set-cookie" in res.headers
+        ):
+            return
+
+        cache_control = res.headers.get("cache-control")
+        if cache_control is not None:
+            directives = parse_cache_control(cache_control)
+            if any(name in directives for name in _NO_STORE_DIRECTIVES):
+                return
+            max_age = _get_max_age(directives)
+            if max_age is not None:
+                ttl = max_age
+        if ttl <= 0:
+            return
+
+        vary = get_vary(res.headers)
+        if "*" in vary:
+            return
+
+        if isinstance(res.content, str):
+            res.content = res.content.encode("utf-8")
+        body: bytes = res.content
+        if res.conditional and "etag" not in res.headers:
+            # Computed once here instead of on every hit.
+            res.headers["etag"] = make_etag(body)
+        headers = res.headers.copy()
+
+        self._store.set(("vary", base_key), vary, size=_VARY_ENTRY_SIZE)
+        key = (base_key, tuple(req.headers.get(name) for name in vary))
+        cached = CachedResponse(
+            status_code=200,
+            headers=headers,
+            body=body,
+            expires=time.monotonic() + ttl,
+        )
+        size = len(body) + sum(
+            len(name) + len(value) for name, value in headers.items()
+        )
+        self._store.set(key, cached, size=size)
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._store.clear()
+
+    def info(self) -> ResponseCacheInfo:
+        return ResponseCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=self._store.size,
+            max_size=self._store.max_size,
+        )
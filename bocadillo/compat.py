@@ -1,30 +1,41 @@
 """Compatibility utilities (version-dependant, sync/async, etc.)."""
-import asyncio
 import re
-import sys
-from typing import Callable, Coroutine, Iterable
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Union
 
-from starlette.concurrency import run_in_threadpool
-
-try:
-    from contextlib import asynccontextmanager
-except ImportError:  # pragma: no cover
-    assert sys.version_info[:2] == (3, 6)
-    from async_generator import asynccontextmanager
+from .executors import AnyExecutor, run_sync
 
 _camel_regex = re.compile(r"(.)([A-Z][a-z]+)")
 _snake_regex = re.compile(r"([a-z0-9])([A-Z])")
 
 
-async def call_async(func: Callable, *args, sync=False, **kwargs) -> Coroutine:
-    """Call a function in an async manner.
+async def iterate_async(
+    iterable: Union[Iterable, AsyncIterable],
+    executor: AnyExecutor = None,
+    batch_size: int = 1,
+) -> AsyncIterator:
+    """Iterate over a sync or async iterable in an async manner.
 
-    If the function is synchronous (or the `sync` hint flag is set),
-    it is run in the asyncio thread pool.
+    Sync iterables (e.g. generators fetching rows from a database) are
+    advanced in the `executor` (see `run_sync()`) so that they don't block
+    the event loop. Up to `batch_size` items are fetched per call.
     """
-    if sync or not asyncio.iscoroutinefunction(func):
-        return await run_in_threadpool(func, *args, **kwargs)
-    return await func(*args, **kwargs)
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+        return
+
+    iterator = iter(iterable)
+    while True:
+        batch = await run_sync(executor, _next_batch, iterator, batch_size)
+        for item in batch:
+            yield item
+        if len(batch) < batch_size:
+            break
+
+
+def _next_batch(iterator: Iterator, size: int) -> List:
+    return list(islice(iterator, size))
 
 
 def camel_to_snake(name: str) -> str:
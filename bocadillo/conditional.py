@@ -0,0 +1,104 @@
+"""Conditional responses, i.e. `304 Not Modified` handling."""
+import hashlib
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+# Headers describing the representation, which are not sent
+# with `304 Not Modified` responses.
+REPRESENTATION_HEADERS = frozenset(
+    (
+        "content-type",
+        "content-length",
+        "content-encoding",
+        "content-language",
+        "content-disposition",
+        "content-range",
+        "accept-ranges",
+    )
+)
+
+
+def make_etag(body: bytes) -> str:
+    """Build a weak `ETag` out of a response body.
+
+    A weak validator is used because middleware (e.g. GZip) may transform
+    the body without changing the `ETag`.
+    """
+    return f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    if etag.startswith("W/"):
+        return etag[2:]
+    return etag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Compare an `If-None-Match` header with an `ETag`.
+
+    Weak comparison is used, as required for `If-None-Match`.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    tag = _opaque_tag(etag)
+    return any(
+        _opaque_tag(candidate) == tag for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    """Return whether `last_modified` is not later than `if_modified_since`.
+
+    Invalid dates are ignored, i.e. `False` is returned.
+    """
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def if_range_matches(
+    if_range: str, response_headers: Mapping[str, str]
+) -> bool:
+    """Return whether an `If-Range` validator identifies a response.
+
+    The validator is compared with the response's `ETag` (using strong
+    comparison, so weak tags never match) or `Last-Modified` date.
+    """
+    if_range = if_range.strip()
+    if if_range.startswith(("W/", '"')):
+        etag = response_headers.get("etag")
+        return (
+            etag is not None
+            and not if_range.startswith("W/")
+            and if_range == etag.strip()
+        )
+    last_modified = response_headers.get("last-modified")
+    return last_modified is not None and if_range == last_modified.strip()
+
+
+def is_fresh(
+    request_headers: Mapping[str, str], response_headers: Mapping[str, str]
+) -> bool:
+    """Return whether the client's cached copy of a response is fresh.
+
+    `If-None-Match` is compared with the response's `ETag`. If it is
+    absent, `If-Modified-Since` is compared with the response's
+    `Last-Modified` date instead.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = response_headers.get("etag")
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is not None:
+        last_modified = response_headers.get("last-modified")
+        return last_modified is not None and not_modified_since(
+            if_modified_since, last_modified
+        )
+
+    return False
@@ -0,0 +1,366 @@
+"""Thread pools that run synchronous code (views, hooks, middleware)."""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from .exceptions import HTTPError
+
+logger = logging.getLogger(__name__)
+
+
+def _default_max_workers() -> int:
+    # Same default as `ThreadPoolExecutor` on Python 3.8+.
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ExecutorSaturated(HTTPError):
+    """Raised when a call is submitted to an executor that is full.
+
+    As an `HTTPError`, it results in a `503 Service Unavailable` response
+    unless it is handled otherwise.
+    """
+
+    def __init__(self, executor: "Executor"):
+        super().__init__(HTTPStatus.SERVICE_UNAVAILABLE)
+        self.executor = executor
+
+
+class ExecutorMetrics(NamedTuple):
+    """Statistics about an executor."""
+
+    max_workers: int
+    max_queued: Optional[int]
+    # Calls being run by a thread.
+    active: int
+    # Calls waiting for a free thread.
+    queued: int
+    completed: int
+    rejected: int
+    # Time calls spent waiting for a free thread, in seconds.
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def mean_wait_time(self) -> float:
+        started = self.completed + self.active
+        return self.total_wait_time / started if started else 0.0
+
+
+class Executor:
+    """A pool of threads in which synchronous code is run.
+
+    Synchronous views, hooks and middleware callbacks are run in
+    the executor of the application, or in the one of their route.
+    Sharing an executor between several routes isolates them
+    from the rest of the application as a group.
+
+    # Parameters
+    max_workers (int):
+        The number of threads.
+        Defaults to the number of CPUs plus 4, and at most 32.
+    max_queued (int):
+        The maximum number of calls waiting for a free thread.
+        Further calls are rejected with an `ExecutorSaturated` error,
+        i.e. a `503 Service Unavailable` response.
+        Defaults to `None` (no limit).
+    name (str):
+        A prefix for the names of the threads.
+        Defaults to `"bocadillo"`.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_queued: int = None,
+        name: str = "bocadillo",
+    ):
+        if max_workers is None:
+            max_workers = _default_max_workers()
+        assert max_workers > 0, "max_workers must be positive"
+        assert (
+            max_queued is None or max_queued >= 0
+        ), "max_queued must be positive or zero"
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.name = name
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function in a thread of the executor and return its result.
+
+        # Raises
+        ExecutorSaturated: if `max_queued` calls are already waiting.
+        """
+        with self._lock:
+            if (
+                self.max_queued is not None
+                and self._active + self._queued
+                >= self.max_workers + self.max_queued
+            ):
+                self._rejected += 1
+                raise ExecutorSaturated(self)
+            self._queued += 1
+
+        call = partial(func, *args, **kwargs)
+        # Set (under the lock) once the call has left the queue, either
+        # because a thread started it or because it was abandoned, e.g.
+        # when the awaiting task is cancelled or the pool is shut down.
+        dequeued = [False]
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self._pool, self._call, call, time.monotonic(), dequeued
+            )
+        finally:
+            with self._lock:
+                if not dequeued[0]:
+                    dequeued[0] = True
+                    self._queued -= 1
+
+    def _call(
+        self, call: Callable, submitted_at: float, dequeued: List[bool]
+    ) -> Any:
+        wait_time = time.monotonic() - submitted_at
+        with self._lock:
+            if not dequeued[0]:
+                dequeued[0] = True
+                self._queued -= 1
+            self._active += 1
+            self._total_wait_time += wait_time
+            if wait_time > self._max_wait_time:
+                self._max_wait_time = wait_time
+        try:
+            return call()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def metrics(self) -> ExecutorMetrics:
+        """Return statistics about the executor."""
+        with self._lock:
+            return ExecutorMetrics(
+                max_workers=self.max_workers,
+                max_queued=self.max_queued,
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+                rejected=self._rejected,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def shutdown(self, wait: bool = True):
+        """Release the threads of the executor.
+
+        # Parameters
+        wait (bool):
+            Whether to wait for the calls being run to complete.
+            Defaults to `True`.
+        """
+        self._pool.shutdown(wait=wait)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Executor name={self.name!r} max_workers={self.max_workers} "
+            f"max_queued={self.max_queued}>"
+        )
+
+
+class InlineExecutor:
+    """Runs synchronous functions directly in the event loop's thread.
+
+    This avoids a round trip to a thread, but blocks the event loop
+    while the function runs: it is only suitable for functions that
+    return quickly and don't perform I/O.
+
+    # Parameters
+    watchdog (float):
+        If given, a warning is logged when a function blocks the event loop
+        for longer than this many seconds. Defaults to `None` (disabled).
+    """
+
+    def __init__(self, watchdog: float = None):
+        self.watchdog = watchdog
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        if self.watchdog is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed > self.watchdog:
+                logger.warning(
+                    "%s blocked the event loop for %.1f ms "
+                    "(watchdog threshold: %.1f ms). "
+                    "It should not be run inline.",
+                    _get_name(func),
+                    elapsed * 1000,
+                    self.watchdog * 1000,
+                )
+
+    def __repr__(self) -> str:
+        return f"<InlineExecutor watchdog={self.watchdog}>"
+
+
+class Placement(NamedTuple):
+    """Where an adaptive executor runs a synchronous function."""
+
+    name: str
+    inline: bool
+    # Rolling estimate of the function's execution time, in seconds.
+    estimate: float
+    calls: int
+
+
+class _Estimate:
+    __slots__ = ("estimate", "calls", "inline")
+
+    def __init__(self):
+        self.estimate = 0.0
+        self.calls = 0
+        self.inline = False
+
+
+class AdaptiveExecutor:
+    """Runs synchronous functions inline or in threads, as they deserve.
+
+    Functions are first run in the `executor`, and their execution time
+    is measured. Once a function has been called `min_calls` times and
+    its rolling (exponentially weighted) average execution time is below
+    `threshold`, it is run inline, i.e. directly on the event loop.
+    It is moved back to the `executor` as soon as its average execution
+    time exceeds twice the `threshold`.
+
+    # Parameters
+    executor (Executor):
+        The executor of functions that are not run inline.
+        If `None`, the event loop's default executor is used.
+    threshold (float):
+        The average execution time below which functions are run inline,
+        in seconds. Defaults to 200 microseconds, which is in the order of
+        the cost of running a function in a thread.
+    min_calls (int):
+        The number of calls measured before a function can be run inline.
+        Defaults to `20`.
+    smoothing (float):
+        The weight of the latest call in the rolling average, between
+        0 and 1. Defaults to `0.2`.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        threshold: float = 0.0002,
+        min_calls: int = 20,
+        smoothing: float = 0.2,
+    ):
+        assert 0 < smoothing <= 1, "smoothing must be between 0 and 1"
+        self.executor = executor
+        self.threshold = threshold
+        self.min_calls = min_calls
+        self.smoothing = smoothing
+        self._estimates: Dict[Callable, _Estimate] = {}
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        estimate = self._estimates.get(func)
+        if estimate is None:
+            estimate = self._estimates[func] = _Estimate()
+
+        timing: List[float] = []
+        try:
+            if estimate.inline:
+                return _timed(timing, func, args, kwargs)
+            return await run_sync(
+                self.executor, _timed, timing, func, args, kwargs
+            )
+        finally:
+            if timing:
+                self._record(func, estimate, timing[0])
+
+    def _record(self, func: Callable, estimate: _Estimate, elapsed: float):
+        if estimate.calls:
+            estimate.estimate += self.smoothing * (elapsed - estimate.estimate)
+        else:
+            estimate.estimate = elapsed
+        estimate.calls += 1
+
+        if estimate.inline:
+            inline = estimate.estimate <= 2 * self.threshold
+        else:
+            inline = (
+                estimate.calls >= self.min_calls
+                and estimate.estimate < self.threshold
+            )
+        if inline != estimate.inline:
+            estimate.inline = inline
+            logger.debug(
+                "%s is now run %s (average execution time: %.1f us).",
+                _get_name(func),
+                "inline" if inline else "in a thread",
+                estimate.estimate * 1e6,
+            )
+
+    def placements(self) -> List[Placement]:
+        """Return where each function is currently run."""
+        return [
+            Placement(
+                name=_get_name(func),
+                inline=estimate.inline,
+                estimate=estimate.estimate,
+                calls=estimate.calls,
+            )
+            for func, estimate in self._estimates.items()
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"<AdaptiveExecutor executor={self.executor!r} "
+            f"threshold={self.threshold}>"
+        )
+
+
+def _timed(timing: List[float], func: Callable, args: tuple, kwargs: dict):
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timing.append(time.perf_counter() - start)
+
+
+def _get_name(func: Callable) -> str:
+    return getattr(func, "__qualname__", repr(func))
+
+
+AnyExecutor = Union[Executor, InlineExecutor, AdaptiveExecutor]
+
+
+async def run_sync(
+    executor: Optional[AnyExecutor], func: Callable, *args, **kwargs
+) -> Any:
+    """Run a synchronous function in an executor.
+
+    If `executor` is `None`, the event loop's default executor is used.
+    """
+    if executor is None:
+        return await run_in_threadpool(func, *args, **kwargs)
+    return await executor.run(func, *args, **kwargs)
@@ -0,0 +1,155 @@
+"""Sending files from disk, with support for HTTP range requests."""
+import mimetypes
+import os
+from email.utils import formatdate
+from typing import NamedTuple, Optional
+from urllib.parse import quote
+
+from starlette.concurrency import run_in_threadpool
+
+CHUNK_SIZE = 64 * 1024
+
+# ASGI extension that lets servers send files without copying them
+# into user space, e.g. using `sendfile()`.
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class ByteRange(NamedTuple):
+    """A range of bytes, with an inclusive `end`."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when none of the requested bytes exist in the file."""
+
+
+def parse_range(value: str, size: int) -> Optional[ByteRange]:
+    """Parse the value of a `Range` header for a file of the given size.
+
+    Only single byte ranges are supported: `None` is returned for other
+    (or invalid) ranges, which means the header should be ignored
+    and the whole file sent.
+
+    # Raises
+    RangeNotSatisfiable: if the range starts past the end of the file.
+    """
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start, sep, end = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if not start:
+            # Suffix range, e.g. `bytes=-500` (the last 500 bytes).
+            suffix = int(end)
+            if suffix <= 0 or size == 0:
+                raise RangeNotSatisfiable
+            return ByteRange(max(size - suffix, 0), size - 1)
+        first = int(start)
+        last = int(end) if end else None
+    except ValueError:
+        return None
+
+    if first < 0 or (last is not None and last < first):
+        return None
+    if first >= size:
+        raise RangeNotSatisfiable
+    if last is None or last >= size:
+        last = size - 1
+    return ByteRange(first, last)
+
+
+class FileBody:
+    """The body of a response that is read from a file on disk.
+
+    The file is inspected (but not opened) on creation.
+
+    # Parameters
+    path (str): the path to the file.
+    chunk_size (int):
+        The size of chunks read from the file when it cannot be sent
+        by the server directly.
+
+    # Raises
+    FileNotFoundError: if the file does not exist.
+    """
+
+    __slots__ = ("path", "size", "mtime", "chunk_size")
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        stat = os.stat(path)
+        self.path = path
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.chunk_size = chunk_size
+
+    @property
+    def etag(self) -> str:
+        return f'"{int(self.mtime):x}-{self.size:x}"'
+
+    @property
+    def last_modified(self) -> str:
+        return formatdate(self.mtime, usegmt=True)
+
+    async def send(self, send, byte_range: ByteRange, zerocopy: bool):
+        """Send a range of bytes from the file as response body messages."""
+        if byte_range.length <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        file = await run_in_threadpool(open, self.path, "rb")
+        try:
+            if zerocopy:
+                await send(
+                    {
+                        "type": ZEROCOPY_EXTENSION,
+                        "file": file,
+                        "offset": byte_range.start,
+                        "count": byte_range.length,
+                    }
+                )
+                return
+
+            await run_in_threadpool(file.seek, byte_range.start)
+            remaining = byte_range.length
+            while remaining > 0:
+                chunk = await run_in_threadpool(
+                    file.read, min(self.chunk_size, remaining)
+                )
+                if not chunk:  # The file was truncated.
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(file.close)
+
+
+def guess_media_type(filename: str) -> str:
+    media_type, _ = mimetypes.guess_type(filename)
+    return media_type or "application/octet-stream"
+
+
+def content_disposition(filename: str) -> str:
+    """Build a `Content-Disposition` header to download a file."""
+    try:
+        filename.encode("latin-1")
+    except UnicodeEncodeError:
+        return f"attachment; filename*=utf-8''{quote(filename)}"
+    filename = filename.replace("\\", "\\\\").replace('"', '\\"')
+    return f'attachment; filename="{filename}"'
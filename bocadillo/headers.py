@@ -0,0 +1,95 @@
+"""Response headers."""
+from typing import Dict, Iterator, List, Mapping, MutableMapping, Tuple
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+# Headers sent by many responses, which are encoded once and for all.
+# Other headers are often unique to a response (e.g. `etag`, `set-cookie`),
+# so caching their encoded form would not pay off.
+_COMMON_HEADERS: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {
+    (key, value): (key.encode("latin-1"), value.encode("latin-1"))
+    for key, value in (
+        ("content-type", "application/json"),
+        ("content-type", "application/x-ndjson"),
+        ("content-type", "application/octet-stream"),
+        ("content-type", "text/plain"),
+        ("content-type", "text/html"),
+        ("content-type", "text/css"),
+        ("content-type", "text/csv"),
+        ("content-type", "application/javascript"),
+        ("accept-ranges", "bytes"),
+    )
+}
+
+
+def encode_header(key: str, value: str) -> Tuple[bytes, bytes]:
+    """Encode a header into a `(key, value)` pair of bytes."""
+    encoded = _COMMON_HEADERS.get((key, value))
+    if encoded is None:
+        return key.encode("latin-1"), value.encode("latin-1")
+    return encoded
+
+
+class Headers(MutableMapping):
+    """A case-insensitive, multi-valued mapping of headers.
+
+    Header names are normalized to lowercase. Setting a header replaces
+    all its values; use `add()` to send a header multiple times,
+    e.g. `set-cookie`.
+
+    # Parameters
+    headers (dict, optional): initial headers.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, headers: Mapping[str, str] = None):
+        self._store: Dict[str, List[str]] = {}
+        if headers is not None:
+            self.update(headers)
+
+    def __getitem__(self, key: str) -> str:
+        return self._store[key.lower()][-1]
+
+    def __setitem__(self, key: str, value: str):
+        self._store[key.lower()] = [value]
+
+    def __delitem__(self, key: str):
+        del self._store[key.lower()]
+
+    def __contains__(self, key) -> bool:
+        return key.lower() in self._store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._store!r})"
+
+    def add(self, key: str, value: str):
+        """Add a value to a header, preserving existing values."""
+        self._store.setdefault(key.lower(), []).append(value)
+
+    def copy(self) -> "Headers":
+        """Return a copy of the headers."""
+        headers = Headers()
+        headers._store = {
+            key: list(values) for key, values in self._store.items()
+        }
+        return headers
+
+    def getlist(self, key: str) -> List[str]:
+        """Return all the values of a header."""
+        return list(self._store.get(key.lower(), ()))
+
+    @property
+    def raw(self) -> RawHeaders:
+        """The headers encoded as a list of `(key, value)` pairs of bytes."""
+        return [
+            encode_header(key, value)
+            for key, values in self._store.items()
+            for value in values
+        ]
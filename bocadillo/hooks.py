@@ -1,23 +1,20 @@
-from collections import defaultdict
+import asyncio
 from functools import wraps
-from typing import Callable, Union, Dict, Coroutine
+from typing import Callable, Dict, List, Optional, Tuple, Union, Coroutine
 
-from .compat import call_async, asynccontextmanager
+from .executors import run_sync
 from .request import Request
 from .response import Response
 from .routing import Route
 
 HookFunction = Callable[[Request, Response, dict], Coroutine]
-HookCollection = Dict[Route, HookFunction]
+HookCollection = Dict[Route, List[HookFunction]]
+HookChain = Callable[[Request, Response, dict], Coroutine]
 
 BEFORE = "before"
 AFTER = "after"
 
 
-async def empty_hook(req: Request, res: Response, params: dict):
-    pass
-
-
 class HooksBase:
     """Base class for hooks managers.
 
@@ -83,25 +80,75 @@ class HooksBase:
 
 
 class Hooks(HooksBase):
-    """A concrete hooks manager that stores hooks by route."""
+    """A concrete hooks manager that stores hooks by route.
+
+    Hooks of a route are nested like the decorators that registered them:
+    `before` hooks run from the top-most decorator down,
+    and `after` hooks from the bottom-most decorator up.
+
+    The hooks of a route and its view are compiled into a single
+    coroutine function when a hook is registered, see `get_chain()`.
+    """
 
     route_class = Route
 
     def __init__(self):
-        self._hooks: Dict[str, HookCollection] = {
-            BEFORE: defaultdict(lambda: empty_hook),
-            AFTER: defaultdict(lambda: empty_hook),
-        }
+        self._hooks: Dict[str, HookCollection] = {BEFORE: {}, AFTER: {}}
+        self._chains: Dict[Route, HookChain] = {}
 
     def store_hook(self, hook: str, hook_function: HookFunction, route: Route):
-        self._hooks[hook][route] = hook_function
+        hooks = self._hooks[hook].setdefault(route, [])
+        # Hook decorators are applied from the bottom up, so the most
+        # recently registered hook is the outer-most one.
+        if hook == BEFORE:
+            hooks.insert(0, hook_function)
+        else:
+            hooks.append(hook_function)
+        self._chains[route] = _compile_chain(
+            route,
+            tuple(self._hooks[BEFORE].get(route, ())),
+            tuple(self._hooks[AFTER].get(route, ())),
+        )
+
+    def get_chain(self, route: Route) -> Optional[HookChain]:
+        """Return the compiled hooks chain of a route.
+
+        It is a coroutine function with the `(req, res, params)` signature
+        which calls the hooks and the route's view.
+        `None` is returned if the route has no hooks.
+        """
+        return self._chains.get(route)
+
+
+def _compile_chain(
+    route: Route,
+    before: Tuple[HookFunction, ...],
+    after: Tuple[HookFunction, ...],
+) -> HookChain:
+    if not after:
+
+        async def chain(req: Request, res: Response, params: dict):
+            for hook_function in before:
+                await hook_function(req, res, params)
+            await route(req, res, **params)
+
+    elif not before:
+
+        async def chain(req: Request, res: Response, params: dict):
+            await route(req, res, **params)
+            for hook_function in after:
+                await hook_function(req, res, params)
 
-    @asynccontextmanager
-    async def on(self, route, request, response, params):
-        """Execute `before` hooks on enter and `after` hooks on exit."""
-        await call_async(self._hooks[BEFORE][route], request, response, params)
-        yield
-        await call_async(self._hooks[AFTER][route], request, response, params)
+    else:
+
+        async def chain(req: Request, res: Response, params: dict):
+            for hook_function in before:
+                await hook_function(req, res, params)
+            await route(req, res, **params)
+            for hook_function in after:
+                await hook_function(req, res, params)
+
+    return chain
 
 
 class HooksMixin:
@@ -147,22 +194,58 @@ class HooksMixin:
         return self.get_hooks().after(hook_function, *args, **kwargs)
 
 
+def _is_async_callable(func: Callable) -> bool:
+    return asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
 def _prepare_async_hook_function(
     full_hook_function, *args, **kwargs
 ) -> HookFunction:
-    async def hook_function(req: Request, res: Response, params: dict):
-        await call_async(full_hook_function, req, res, params, *args, **kwargs)
+    # Whether the hook function is sync is checked once, here,
+    # instead of on every call.
+    if _is_async_callable(full_hook_function):
+
+        async def hook_function(req: Request, res: Response, params: dict):
+            await full_hook_function(req, res, params, *args, **kwargs)
+
+    else:
+
+        async def hook_function(req: Request, res: Response, params: dict):
+            await run_sync(
+                res.executor,
+                full_hook_function,
+                req,
+                res,
+                params,
+                *args,
+                **kwargs,
+            )
 
     return hook_function
 
 
 def _with_hook(view: Callable, hook: str, hook_function: HookFunction):
-    @wraps(view)
-    async def with_hook(self, req, res, **kw):
-        if hook == BEFORE:
+    if _is_async_callable(view):
+        call_view = view
+    else:
+
+        async def call_view(self, req, res, **kw):
+            await run_sync(res.executor, view, self, req, res, **kw)
+
+    if hook == BEFORE:
+
+        @wraps(view)
+        async def with_hook(self, req, res, **kw):
             await hook_function(req, res, kw)
-        await call_async(view, self, req, res, **kw)
-        if hook == AFTER:
+            await call_view(self, req, res, **kw)
+
+    else:
+
+        @wraps(view)
+        async def with_hook(self, req, res, **kw):
+            await call_view(self, req, res, **kw)
             await hook_function(req, res, kw)
 
     return with_hook
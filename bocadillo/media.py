@@ -1,12 +1,31 @@
 import json
-from typing import Any, Optional, Callable, Dict
+from collections.abc import Iterator
+from typing import (
+    Any,
+    AnyStr,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .compat import iterate_async
+from .executors import AnyExecutor
 from .exceptions import UnsupportedMediaType
 
-MediaHandler = Callable[[Any], str]
+MediaHandler = Callable[[Any], AnyStr]
 
+# Serialized values are buffered and sent in chunks of about this size.
+STREAM_CHUNK_SIZE = 64 * 1024
+# Number of items fetched at once from sync iterators being streamed.
+STREAM_BATCH_SIZE = 256
 
-def handle_json(value: dict) -> str:
+
+def handle_json(value: Any) -> str:
     return json.dumps(value)
 
 
@@ -14,23 +33,139 @@ def handle_text(value: Any) -> str:
     return str(value)
 
 
-def get_default_handlers() -> dict:
+def _with_fallback(dumps: MediaHandler) -> MediaHandler:
+    # Third-party backends reject some values that the standard library
+    # accepts (e.g. integers beyond 64 bits, or non-string keys):
+    # those are serialized by the standard library instead.
+    def handle(value: Any) -> AnyStr:
+        try:
+            return dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            return handle_json(value)
+
+    return handle
+
+
+def _orjson_handler() -> MediaHandler:
+    import orjson
+
+    def handle_orjson(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    return _with_fallback(handle_orjson)
+
+
+def _ujson_handler() -> MediaHandler:
+    import ujson
+
+    def handle_ujson(value: Any) -> bytes:
+        return ujson.dumps(value, ensure_ascii=False).encode()
+
+    return _with_fallback(handle_ujson)
+
+
+def _rapidjson_handler() -> MediaHandler:
+    import rapidjson
+
+    def handle_rapidjson(value: Any) -> bytes:
+        return rapidjson.dumps(value, ensure_ascii=False).encode()
+
+    return _with_fallback(handle_rapidjson)
+
+
+# Ordered from fastest to slowest.
+JSON_BACKENDS: Dict[str, Callable[[], MediaHandler]] = {
+    "orjson": _orjson_handler,
+    "ujson": _ujson_handler,
+    "rapidjson": _rapidjson_handler,
+    "json": lambda: handle_json,
+}
+
+
+def get_json_handler(backend: str = None) -> MediaHandler:
+    """Return a JSON media handler.
+
+    Values that a third-party backend cannot serialize, but the standard
+    library can, are serialized by the standard library. Other values may
+    be serialized differently than by the standard library, e.g. orjson
+    serializes `NaN` as `null`, and dates as strings.
+
+    # Parameters
+    backend (str):
+        One of `"orjson"`, `"ujson"`, `"rapidjson"` or `"json"` (the standard
+        library). Defaults to the fastest one that is installed.
+
+    # Raises
+    ImportError:
+        If the given backend is not installed.
+    """
+    if backend is not None:
+        assert backend in JSON_BACKENDS, (
+            f"Unknown JSON backend: '{backend}' "
+            f"(available: {', '.join(JSON_BACKENDS)})"
+        )
+        return JSON_BACKENDS[backend]()
+
+    for get_handler in JSON_BACKENDS.values():
+        try:
+            return get_handler()
+        except ImportError:
+            continue
+
+
+def _to_bytes(content: AnyStr) -> bytes:
+    if isinstance(content, bytes):
+        return content
+    return content.encode("utf-8")
+
+
+def ndjson_handler(handle_json: MediaHandler) -> MediaHandler:
+    """Build an NDJSON media handler out of a JSON media handler.
+
+    The resulting handler serializes an iterable of values as
+    newline-delimited JSON.
+    """
+
+    def handle_ndjson(values: Iterable) -> bytes:
+        return b"".join(
+            _to_bytes(handle_json(value)) + b"\n" for value in values
+        )
+
+    return handle_ndjson
+
+
+def get_default_handlers(json_backend: Optional[str] = "json") -> dict:
+    handle_json = get_json_handler(json_backend)
     return {
         Media.JSON: handle_json,
+        Media.NDJSON: ndjson_handler(handle_json),
         Media.PLAIN_TEXT: handle_text,
         Media.HTML: handle_text,
     }
 
 
+def is_stream(value: Any) -> bool:
+    """Return whether a value should be serialized incrementally.
+
+    Iterators (e.g. generators) and async iterables (e.g. async generators)
+    are streamed. Other values, including lists, are serialized at once.
+    """
+    return hasattr(value, "__aiter__") or isinstance(value, Iterator)
+
+
 class Media:
     """Registry of media handlers."""
 
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     PLAIN_TEXT = "text/plain"
     HTML = "text/html"
 
     def __init__(
-        self, media_type: str, handlers: Dict[str, MediaHandler] = None
+        self,
+        media_type: str,
+        handlers: Dict[str, MediaHandler] = None,
+        json_backend: Optional[str] = "json",
     ):
         """Create a media registry.
 
@@ -39,11 +174,14 @@ class Media:
         media_type : str
             The default media type that will be used when serializing values.
         handlers : dict of str -> MediaHandler, optional
-            A mapping of media type to an (Any) -> str callable.
+            A mapping of media type to an (Any) -> str or bytes callable.
             Defaults to built-in media handlers.
+        json_backend : str, optional
+            The JSON backend of the built-in JSON and NDJSON handlers
+            (see `get_json_handler()`). Defaults to the standard library.
         """
         if handlers is None:
-            handlers = get_default_handlers()
+            handlers = get_default_handlers(json_backend)
         self.handlers = handlers
         self.type = media_type
 
@@ -60,6 +198,62 @@ class Media:
         handler = self.handlers[media_type]
         return handler(value)
 
+    async def serialize_stream(
+        self,
+        values: Union[Iterable, AsyncIterable],
+        media_type: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        executor: AnyExecutor = None,
+    ) -> AsyncIterator[bytes]:
+        """Serialize the items of an iterable incrementally.
+
+        Items are serialized one by one with the JSON media handler if
+        `media_type` is JSON (resulting in a JSON array) or NDJSON
+        (resulting in one JSON document per line), and with the handler of
+        `media_type` otherwise (resulting in their concatenation).
+
+        Parameters
+        ----------
+        values : iterable or async iterable
+        media_type : str
+        chunk_size : int, optional
+            Serialized items are buffered until at least this many bytes
+            are available.
+        executor : executor, optional
+            The executor in which the items of sync iterables are fetched,
+            in batches, so that they don't block the event loop.
+            Defaults to the event loop's default executor.
+
+        Yields
+        ------
+        chunk : bytes
+        """
+        start, separator, terminator, end = _STREAM_FRAMING.get(
+            media_type, _NO_FRAMING
+        )
+        if media_type in _STREAM_FRAMING:
+            handler = self.handlers[Media.JSON]
+        else:
+            handler = self.handlers[media_type]
+
+        buffer = bytearray(start)
+        first = True
+        async for value in iterate_async(
+            values, executor=executor, batch_size=STREAM_BATCH_SIZE
+        ):
+            if first:
+                first = False
+            else:
+                buffer += separator
+            buffer += _to_bytes(handler(value))
+            buffer += terminator
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += end
+        if buffer:
+            yield bytes(buffer)
+
     @property
     def type(self) -> str:
         """Return the default media type."""
@@ -83,3 +277,12 @@ class Media:
                 media_type, available=list(self.handlers)
             )
         self._default_type = media_type
+
+
+# How serialized items are laid out in streams:
+# (start, separator, terminator, end).
+_STREAM_FRAMING: Dict[str, Tuple[bytes, bytes, bytes, bytes]] = {
+    Media.JSON: (b"[", b",", b"", b"]"),
+    Media.NDJSON: (b"", b"", b"\n", b""),
+}
+_NO_FRAMING = (b"", b"", b"", b"")
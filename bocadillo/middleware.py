@@ -1,7 +1,8 @@
 """Bocadillo middleware definition."""
-from typing import Coroutine, Callable
+import asyncio
+from typing import Coroutine, Callable, Optional
 
-from bocadillo.compat import call_async
+from bocadillo.executors import Executor, run_sync
 from bocadillo.response import Response
 from .request import Request
 
@@ -10,7 +11,14 @@ Dispatcher = Callable[[Request], Coroutine]
 
 
 class Middleware:
-    """Base class for middleware classes."""
+    """Base class for middleware classes.
+
+    Synchronous `before_dispatch()` and `after_dispatch()` callbacks are run
+    in the `executor`, which is set to the application's executor
+    when the middleware is added to an application.
+    """
+
+    executor: Optional[Executor] = None
 
     def __init__(self, dispatch: Dispatcher, **kwargs):
         self.dispatch = dispatch
@@ -20,15 +28,20 @@ class Middleware:
         res: Response = None
 
         if hasattr(self, "before_dispatch"):
-            res = await call_async(self.before_dispatch, req)
+            res = await self._call(self.before_dispatch, req)
 
         res = res or await self.dispatch(req)
 
         if hasattr(self, "after_dispatch"):
-            res = await call_async(self.after_dispatch, req, res) or res
+            res = await self._call(self.after_dispatch, req, res) or res
 
         return res
 
+    async def _call(self, callback: Callable, *args):
+        if asyncio.iscoroutinefunction(callback):
+            return await callback(*args)
+        return await run_sync(self.executor, callback, *args)
+
 
 # TODO: remove in v0.8
 RoutingMiddleware = Middleware
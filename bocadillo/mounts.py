@@ -0,0 +1,55 @@
+"""Lookup of mounted apps by path prefix."""
+from typing import Dict, Optional, Tuple, Union
+
+from .types import ASGIApp, WSGIApp
+
+App = Union[ASGIApp, WSGIApp]
+
+
+class _Node:
+    __slots__ = ("children", "app", "prefix")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.app: Optional[App] = None
+        self.prefix = ""
+
+
+class MountTree:
+    """A prefix tree of mounted apps, keyed by URL path segments.
+
+    A path matches a prefix only if it starts with all the prefix's
+    segments, e.g. `/static` matches `/static` and `/static/app.css`,
+    but not `/staticky`. When several prefixes match, the longest wins.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+
+    def add(self, prefix: str, app: App):
+        """Mount an app at the given prefix, e.g. `"/static"`."""
+        prefix = prefix.rstrip("/")
+        node = self._root
+        for segment in prefix.split("/")[1:]:
+            node = node.children.setdefault(segment, _Node())
+        node.app = app
+        node.prefix = prefix
+
+    def find(self, path: str) -> Optional[Tuple[App, str]]:
+        """Find the app mounted at the longest prefix of a path.
+
+        # Returns
+        result (tuple or None):
+            An `(app, prefix)` tuple, or `None` if no app was found.
+        """
+        node = self._root
+        found = node if node.app is not None else None
+        for segment in path.split("/")[1:]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.app is not None:
+                found = node
+        if found is None:
+            return None
+        return found.app, found.prefix
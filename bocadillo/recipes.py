@@ -1,5 +1,6 @@
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
+from .executors import Executor
 from .hooks import HooksMixin, HooksBase, HookFunction
 from .templates import TemplatesMixin
 
@@ -33,12 +34,11 @@ class RecipeRoute:
 
         # Hooks registered via @before and/or @after on top of the @route
         # decorator need to be manually registered with @api.before, @api.after.
+        # They are registered in the same order to preserve nesting.
         def _register_hook(hook, hook_decorator):
             nonlocal self, route
-            if self.hooks.get(hook) is None:
-                return
-            hook_function = self.hooks[hook]
-            route = hook_decorator(hook_function)(route)
+            for hook_function in self.hooks.get(hook, ()):
+                route = hook_decorator(hook_function)(route)
 
         _register_hook("before", api.before)
         _register_hook("after", api.after)
@@ -52,7 +52,7 @@ class RecipeHooks(HooksBase):
     def store_hook(
         self, hook: str, hook_function: HookFunction, route: RecipeRoute
     ):
-        route.hooks[hook] = hook_function
+        route.hooks.setdefault(hook, []).append(hook_function)
 
 
 class RecipeBase:
@@ -72,20 +72,34 @@ class Recipe(TemplatesMixin, HooksMixin, RecipeBase):
         Defaults to `"/" + name`.
     templates_dir (str):
         See #API.
+    executor (Executor):
+        If given, synchronous views and hooks of the recipe's routes
+        are run in this executor, unless a route specifies its own
+        or is inline.
     """
 
     _hooks_manager_class = RecipeHooks
 
-    def __init__(self, name: str, prefix: str = None, **kwargs):
+    def __init__(
+        self,
+        name: str,
+        prefix: str = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         if prefix is None:
             prefix = f"/{name}"
         assert prefix.startswith("/"), "recipe prefix must start with '/'"
         self._name = name
         self._prefix = prefix
+        self._executor = executor
         self._routes: List[RecipeRoute] = []
 
     def route(self, *args, **kwargs):
+        if self._executor is not None and not kwargs.get("inline"):
+            kwargs.setdefault("executor", self._executor)
+
         def register(view):
             route = RecipeRoute(
                 *args, view=view, namespace=self._name, **kwargs
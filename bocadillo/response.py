@@ -1,47 +1,203 @@
-from typing import AnyStr, Any, Callable, Coroutine, Optional
+from typing import (
+    AnyStr,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Optional,
+    Union,
+)
 
 from starlette.background import BackgroundTask
 from starlette.requests import Request
-from starlette.responses import Response as _Response
 
-from .media import Media
+from .compat import iterate_async
+from .conditional import (
+    REPRESENTATION_HEADERS,
+    if_range_matches,
+    is_fresh,
+    make_etag,
+)
+from .executors import AnyExecutor
+from .files import (
+    ZEROCOPY_EXTENSION,
+    ByteRange,
+    FileBody,
+    RangeNotSatisfiable,
+    content_disposition,
+    guess_media_type,
+    parse_range,
+)
+from .headers import Headers
+from .media import Media, is_stream
 
 BackgroundFunc = Callable[..., Coroutine]
+Stream = Union[Iterable[AnyStr], AsyncIterable[AnyStr]]
+
+_DEFAULT_CONTENT_TYPE = (b"content-type", Media.PLAIN_TEXT.encode())
+_CONDITIONAL_METHODS = frozenset(("GET", "HEAD"))
 
 
 class Response:
-    """Response builder."""
+    """Response builder.
+
+    Content can be set using `text`, `html` or `media`, which serialize
+    the given value and set the `Content-Type` accordingly, or directly
+    using `content`.
+
+    If `media` is given an iterator or an async iterable, its items are
+    serialized and sent incrementally. Arbitrary content can be streamed
+    using `stream()`, and files using `file()`.
+
+    If `conditional` is true, `GET` and `HEAD` requests whose cached copy
+    is still `fresh` get a `304 Not Modified` response. An `ETag` is
+    generated out of the body, unless one is set explicitly.
+    """
+
+    __slots__ = (
+        "request",
+        "content",
+        "status_code",
+        "_headers",
+        "conditional",
+        "executor",
+        "byte_ranges",
+        "_media",
+        "_stream",
+        "_file",
+        "_background",
+    )
 
     def __init__(self, request: Request, media: Media):
         self.request = request
-        self._content: AnyStr = None
+        self.content: Optional[AnyStr] = None
         self.status_code: int = None
-        self.headers = {}
+        self.headers = Headers()
+        self.conditional = False
+        # Executor of synchronous views and hooks, set by the application.
+        self.executor: Optional[AnyExecutor] = None
+        # Whether range requests are supported for files, set by the
+        # application. They are not when middleware transforms the body.
+        self.byte_ranges = True
         self._media = media
+        self._stream: Optional[AsyncIterator[bytes]] = None
+        self._file: Optional[FileBody] = None
         self._background: BackgroundFunc = None
 
     def _set_media(self, value: Any, media_type: str):
-        content = self._media.serialize(value, media_type=media_type)
+        if is_stream(value):
+            self._stream = self._media.serialize_stream(
+                value, media_type=media_type, executor=self.executor
+            )
+            self.content = None
+        else:
+            self.content = self._media.serialize(value, media_type=media_type)
+            self._stream = None
+        self._file = None
         self.headers["content-type"] = media_type
-        self._content = content
+
+    def _set_text(self, value: Any):
+        self._set_media(value, media_type=Media.PLAIN_TEXT)
+
+    def _set_html(self, value: Any):
+        self._set_media(value, media_type=Media.HTML)
+
+    def _set_default_media(self, value: Any):
+        self._set_media(value, media_type=self._media.type)
 
     @property
-    def content(self) -> Optional[AnyStr]:
-        return self._content
-
-    @content.setter
-    def content(self, content: AnyStr):
-        self._content = content
-
-    def __setattr__(self, key, value):
-        if key == "text":
-            self._set_media(value, media_type=Media.PLAIN_TEXT)
-        elif key == "html":
-            self._set_media(value, media_type=Media.HTML)
-        elif key == "media":
-            self._set_media(value, media_type=self._media.type)
+    def headers(self) -> Headers:
+        """The response's headers.
+
+        A mapping (e.g. a `dict`) can be assigned: it is converted
+        to `Headers`.
+        """
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Mapping[str, str]):
+        if not isinstance(headers, Headers):
+            headers = Headers(headers)
+        self._headers = headers
+
+    text = property(fset=_set_text, doc="Set the content as plain text.")
+    html = property(fset=_set_html, doc="Set the content as HTML.")
+    media = property(
+        fset=_set_default_media,
+        doc="Set the content using the configured media type.",
+    )
+
+    def stream(
+        self, source: Union[Stream, Callable[..., Stream]], *args, **kwargs
+    ):
+        """Stream the response body from an iterable of chunks.
+
+        Chunks can be `bytes` or `str` (encoded to UTF-8), and are sent
+        as soon as they are produced. Chunks of sync iterables are produced
+        in the executor of the route, so that they don't block the event loop.
+
+        Can be used as a decorator on a (possibly async) generator function,
+        which is called with the given `args` and `kwargs`.
+
+        # Parameters
+        source:
+            A sync or async iterable of chunks, or a function returning one.
+
+        # Example
+        ```python
+        >>> @res.stream
+        ... async def numbers():
+        ...     for i in range(10):
+        ...         yield str(i)
+        ```
+        """
+        iterable = source(*args, **kwargs) if callable(source) else source
+        self._stream = _encode_chunks(iterable, self.executor)
+        self._file = None
+        self.content = None
+        return source
+
+    def file(
+        self,
+        path: str,
+        filename: str = None,
+        media_type: str = None,
+        chunk_size: int = None,
+    ):
+        """Send a file from disk.
+
+        The file is streamed in chunks, or sent by the server directly
+        if it supports the ASGI zero-copy send extension.
+        Single byte ranges can be requested using the `Range` and `If-Range`
+        headers, which results in a `206 Partial Content` response.
+
+        # Parameters
+        path (str): the path to the file.
+        filename (str):
+            If given, the file is sent as an attachment with this name.
+        media_type (str):
+            The `Content-Type` of the response.
+            Defaults to one guessed from the file's name.
+        chunk_size (int):
+            The size of chunks read from the file. Defaults to 64 KiB.
+
+        # Raises
+        FileNotFoundError: if the file does not exist.
+        """
+        if chunk_size is None:
+            self._file = FileBody(path)
         else:
-            super().__setattr__(key, value)
+            self._file = FileBody(path, chunk_size=chunk_size)
+        self._stream = None
+        self.content = None
+        if media_type is None:
+            media_type = guess_media_type(filename or path)
+        self.headers["content-type"] = media_type
+        if filename is not None:
+            self.headers["content-disposition"] = content_disposition(filename)
 
     def background(self, func: BackgroundFunc, *args, **kwargs):
         """Register a coroutine function to be executed in the background."""
@@ -58,18 +214,182 @@ class Response:
             return BackgroundTask(self._background)
         return None
 
+    @property
+    def fresh(self) -> bool:
+        """Whether the client's cached copy of the response is still valid.
+
+        This is determined by comparing the request's `If-None-Match`
+        (or `If-Modified-Since`) header with the `ETag` (or `Last-Modified`)
+        header of the response. Views can set these headers early and return
+        without rendering the response if it is fresh.
+        """
+        return is_fresh(self.request.headers, self.headers)
+
+    def _is_not_modified(self) -> bool:
+        return (
+            self.conditional
+            and self.status_code == 200
+            and self.request.method in _CONDITIONAL_METHODS
+            and self.fresh
+        )
+
+    async def _send_not_modified(self, send):
+        self.status_code = 304
+        headers = self.headers
+        for key in REPRESENTATION_HEADERS:
+            if key in headers:
+                del headers[key]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": headers.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
     async def __call__(self, receive, send):
         """Build and send the response."""
         if self.status_code is None:
             self.status_code = 200
 
-        if self.status_code != 204:
-            self.headers.setdefault("content-type", Media.PLAIN_TEXT)
+        if self._file is not None:
+            await self._send_file(send)
+        elif self._stream is not None:
+            await self._send_stream(send)
+        else:
+            await self._send_content(send)
+
+        if self._background is not None:
+            await self._background()
+
+    async def _send_content(self, send):
+        content = self.content
+        if content is None:
+            body = b""
+        elif isinstance(content, bytes):
+            body = content
+        else:
+            body = content.encode("utf-8")
+
+        headers = self.headers
+        if (
+            self.conditional
+            and self.status_code == 200
+            and self.request.method in _CONDITIONAL_METHODS
+        ):
+            if "etag" not in headers:
+                headers["etag"] = make_etag(body)
+            if self.fresh:
+                await self._send_not_modified(send)
+                return
+
+        raw_headers = headers.raw
+        if "content-type" not in headers and self.status_code != 204:
+            raw_headers.append(_DEFAULT_CONTENT_TYPE)
+        if body and "content-length" not in headers:
+            raw_headers.append((b"content-length", str(len(body)).encode()))
 
-        response = _Response(
-            content=self.content,
-            headers=self.headers,
-            status_code=self.status_code,
-            background=self.background_task,
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": raw_headers,
+            }
         )
-        await response(receive, send)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_stream(self, send):
+        # The length of the body is unknown, so no `Content-Length`
+        # is sent and the server falls back to chunked encoding.
+        # Each chunk is sent as soon as it is produced, and awaiting `send()`
+        # lets the server apply backpressure.
+        if self._is_not_modified():
+            await self._send_not_modified(send)
+            return
+
+        headers = self.headers
+        raw_headers = headers.raw
+        if "content-type" not in headers:
+            raw_headers.append(_DEFAULT_CONTENT_TYPE)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": raw_headers,
+            }
+        )
+        async for chunk in self._stream:
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": True}
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send_file(self, send):
+        file = self._file
+        headers = self.headers
+        if self.byte_ranges:
+            headers["accept-ranges"] = "bytes"
+        if "last-modified" not in headers:
+            headers["last-modified"] = file.last_modified
+        if "etag" not in headers:
+            headers["etag"] = file.etag
+        if self._is_not_modified():
+            await self._send_not_modified(send)
+            return
+
+        byte_range = ByteRange(0, file.size - 1)
+        request_headers = self.request.headers
+        range_header = request_headers.get("range")
+        if (
+            range_header is not None
+            and self.byte_ranges
+            and self.status_code == 200
+            and self.request.method in ("GET", "HEAD")
+        ):
+            if_range = request_headers.get("if-range")
+            if if_range is None or if_range_matches(if_range, headers):
+                try:
+                    requested = parse_range(range_header, file.size)
+                except RangeNotSatisfiable:
+                    self.status_code = 416
+                    headers["content-range"] = f"bytes */{file.size}"
+                    await self._send_content(send)
+                    return
+                if requested is not None:
+                    byte_range = requested
+                    self.status_code = 206
+                    headers["content-range"] = (
+                        f"bytes {byte_range.start}-{byte_range.end}"
+                        f"/{file.size}"
+                    )
+
+        headers["content-length"] = str(byte_range.length)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": headers.raw,
+            }
+        )
+        if self.request.method == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = self.request.get("extensions") or {}
+        await file.send(
+            send, byte_range, zerocopy=ZEROCOPY_EXTENSION in extensions
+        )
+
+
+async def _encode_chunks(
+    iterable: Stream, executor: Optional[AnyExecutor]
+) -> AsyncIterator[bytes]:
+    # Chunks of sync iterables are fetched one at a time so that
+    # each of them is sent as soon as it is produced.
+    async for chunk in iterate_async(iterable, executor=executor):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if chunk:
+            yield chunk
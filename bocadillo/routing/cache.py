@@ -0,0 +1,104 @@
+"""Caching of route matches."""
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+MISSING = object()
+
+
+class RouteCacheInfo(NamedTuple):
+    """Statistics about a route cache."""
+
+    hits: int
+    not_found_hits: int
+    misses: int
+    size: int
+    maxsize: int
+    not_found_size: int
+    not_found_maxsize: int
+
+
+class _LRU(OrderedDict):
+    """A bounded mapping that evicts least recently used items first."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class RouteCache:
+    """A bounded LRU cache of route matches, keyed by URL path.
+
+    Paths that did not match any route are cached separately, so that
+    floods of unknown paths (e.g. from scanners) cannot evict
+    the matches of known paths.
+
+    # Parameters
+    maxsize (int):
+        The maximum number of cached matches.
+    not_found_maxsize (int):
+        The maximum number of cached paths that did not match any route.
+        Defaults to `maxsize`.
+    """
+
+    def __init__(self, maxsize: int, not_found_maxsize: Optional[int] = None):
+        if not_found_maxsize is None:
+            not_found_maxsize = maxsize
+        self._found = _LRU(maxsize)
+        self._not_found = _LRU(not_found_maxsize)
+        self.hits = 0
+        self.not_found_hits = 0
+        self.misses = 0
+
+    def get(self, path: str) -> Any:
+        """Return the cached value for a path, or `MISSING`.
+
+        `None` is returned if the path is known not to match any route.
+        """
+        value = self._found.get(path, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        if path in self._not_found:
+            self.not_found_hits += 1
+            self._not_found.move_to_end(path)
+            return None
+        self.misses += 1
+        return MISSING
+
+    def set(self, path: str, value: Any):
+        """Cache a value for a path. `None` means the path was not found."""
+        if value is None:
+            if self._not_found.maxsize > 0:
+                self._not_found[path] = None
+        elif self._found.maxsize > 0:
+            self._found[path] = value
+
+    def clear(self):
+        """Remove all cached values. Statistics are kept."""
+        self._found.clear()
+        self._not_found.clear()
+
+    def info(self) -> RouteCacheInfo:
+        return RouteCacheInfo(
+            hits=self.hits,
+            not_found_hits=self.not_found_hits,
+            misses=self.misses,
+            size=len(self._found),
+            maxsize=self._found.maxsize,
+            not_found_size=len(self._not_found),
+            not_found_maxsize=self._not_found.maxsize,
+        )
@@ -1,14 +1,26 @@
-from typing import List
+from typing import List, Optional
 
+from ..executors import Executor
+from .cache import RouteCacheInfo
 from .router import Router
 
 
 class RoutingMixin:
     """Provide routing capabilities to a class."""
 
-    def __init__(self):
-        super().__init__()
-        self._router = Router()
+    def __init__(
+        self,
+        route_cache_size: int = None,
+        route_not_found_cache_size: int = None,
+        routing_engine: str = "tree",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._router = Router(
+            cache_size=route_cache_size,
+            not_found_cache_size=route_not_found_cache_size,
+            engine=routing_engine,
+        )
 
     def route(
         self,
@@ -17,6 +29,11 @@ class RoutingMixin:
         methods: List[str] = None,
         name: str = None,
         namespace: str = None,
+        conditional: bool = None,
+        cache_ttl: float = None,
+        single_flight: bool = False,
+        executor: Executor = None,
+        inline: bool = None,
     ):
         """Register a new route by decorating a view.
 
@@ -34,6 +51,31 @@ class RoutingMixin:
             A namespace for this route (optional).
             If given, will be prefixed to the `name` and separated by a colon,
             e.g. `"blog:index"`.
+        conditional (bool):
+            Whether to send `304 Not Modified` responses when the client's
+            cached copy is fresh, generating an `ETag` if needed.
+            Defaults to the application's `enable_conditional` setting.
+        cache_ttl (float):
+            If given, successful responses to `GET` requests are cached
+            for this many seconds, unless their `Cache-Control` header
+            says otherwise. Cached responses are sent without calling
+            the view or its hooks.
+        single_flight (bool):
+            If `True`, identical concurrent `GET` requests wait for
+            the response to the first one instead of calling the view
+            again. Defaults to `False`.
+        executor (Executor):
+            If given, synchronous views and hooks of this route are run
+            in this executor instead of the application's one.
+            Routes sharing an executor are isolated as a group.
+        inline (bool):
+            If `True`, synchronous views and hooks of this route are run
+            directly on the event loop instead of in a thread.
+            Only suitable for views that return quickly and perform
+            no I/O. Cannot be combined with `executor`.
+            If `False`, they are always run in a thread.
+            Defaults to `None`, i.e. they are run in a thread unless the
+            application's `adaptive_inline` setting moves them inline.
 
         # Raises
         RouteDeclarationError:
@@ -53,7 +95,15 @@ class RoutingMixin:
         ```
         """
         return self._router.route_decorator(
-            pattern=pattern, methods=methods, name=name, namespace=namespace
+            pattern=pattern,
+            methods=methods,
+            name=name,
+            namespace=namespace,
+            conditional=conditional,
+            cache_ttl=cache_ttl,
+            single_flight=single_flight,
+            executor=executor,
+            inline=inline,
         )
 
     def url_for(self, name: str, **kwargs) -> str:
@@ -69,5 +119,14 @@ class RoutingMixin:
         # Raises
         HTTPError(404) : if no route exists for the given `name`.
         """
-        route = self._router.get_route_or_404(name)
-        return route.url(**kwargs)
+        return self._router.get_url_builder_or_404(name)(**kwargs)
+
+    def route_cache_info(self) -> Optional[RouteCacheInfo]:
+        """Return statistics about the route cache.
+
+        # Returns
+        info (RouteCacheInfo or None):
+            A named tuple of hits, misses and sizes,
+            or `None` if the route cache is disabled.
+        """
+        return self._router.cache_info()
@@ -0,0 +1,132 @@
+"""Compilation of route patterns."""
+import re
+from string import Formatter
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import quote
+
+import parse
+
+Converter = Callable[[str, Any], Any]
+Formatting = Callable[[Any], str]
+UrlBuilder = Callable[..., str]
+
+# Format types that are specific to parse, i.e. not understood by `format()`.
+_PARSE_ONLY_TYPES = (
+    "l",
+    "w",
+    "W",
+    "S",
+    "D",
+    "ti",
+    "te",
+    "tg",
+    "ta",
+    "tc",
+    "th",
+    "ts",
+    "tt",
+)
+
+# Characters allowed in URL paths (RFC 3986), except "%".
+_SAFE_CHARS = "/:@!$&'()*+,;="
+_UNSAFE_REGEX = re.compile(r"[^A-Za-z0-9_.\-~/:@!$&'()*+,;=]")
+
+
+def _get_formatting(format_spec: str) -> Formatting:
+    if not format_spec or format_spec.endswith(_PARSE_ONLY_TYPES):
+        return str
+    return lambda value: format(value, format_spec)
+
+
+def _quote(value: str) -> str:
+    if _UNSAFE_REGEX.search(value) is None:
+        return value
+    return quote(value, safe=_SAFE_CHARS)
+
+
+def compile_url_builder(pattern: str) -> UrlBuilder:
+    """Compile a function that builds URL paths for a route pattern.
+
+    Values are formatted according to their format specifier (if it is
+    understood by `format()`) and quoted. URLs of patterns without
+    parameters are only built once.
+    """
+    # Turn the pattern into a template with positional fields only,
+    # e.g. "/{x:d}/{y}" -> "/{0}/{1}".
+    template = ""
+    fields: List[Tuple[str, Formatting]] = []
+    for literal, field_name, format_spec, _ in Formatter().parse(pattern):
+        template += literal.replace("{", "{{").replace("}", "}}")
+        if field_name is not None:
+            template += "{%d}" % len(fields)
+            fields.append((field_name, _get_formatting(format_spec)))
+
+    if not fields:
+        url = template.format()
+        return lambda **kwargs: url
+
+    if len(fields) == 1:
+        (name, formatting), = fields
+        return lambda **kwargs: template.format(
+            _quote(formatting(kwargs[name]))
+        )
+
+    return lambda **kwargs: template.format(
+        *[_quote(formatting(kwargs[name])) for name, formatting in fields]
+    )
+
+
+class RoutePattern:
+    """A route pattern compiled into a regular expression.
+
+    The format string is compiled by [parse] once and for all, and its
+    type conversions (e.g. `{id:d}`) are resolved in advance, so that
+    matching an URL path only requires one regex match followed by
+    the conversion of the extracted values.
+
+    Building URL paths from route parameters is compiled in advance as well.
+
+    [parse]: https://pypi.org/project/parse/
+
+    # Parameters
+    pattern (str): a route pattern given as a format string.
+    """
+
+    def __init__(self, pattern: str):
+        parser = parse.compile(pattern)
+        # NOTE: these are private attributes of parse's `Parser`.
+        # They are only accessed here.
+        self.expression: str = parser._expression
+        self.flags: int = parser._re_flags
+        self._regex = parser._match_re
+        self._fields: List[Tuple[str, str, Optional[Converter]]] = [
+            (
+                group,
+                parser._group_to_name_map[group],
+                parser._type_conversions.get(group),
+            )
+            for group in parser._named_fields
+        ]
+        self.url_builder: UrlBuilder = compile_url_builder(pattern)
+
+    def parse(self, path: str) -> Optional[dict]:
+        """Match an URL path and extract its route parameters.
+
+        # Returns
+        params (dict or None):
+            The converted route parameters if the path matched,
+            `None` otherwise.
+        """
+        match = self._regex.match(path)
+        if match is None:
+            return None
+        values = match.groupdict()
+        params = {}
+        for group, name, convert in self._fields:
+            value = values[group]
+            params[name] = value if convert is None else convert(value, match)
+        return params
+
+    def url(self, **kwargs) -> str:
+        """Build an URL path from route parameters."""
+        return self.url_builder(**kwargs)
@@ -0,0 +1,84 @@
+"""Matching of routes using a single combined regular expression."""
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from .route import Route
+
+_GROUP_REGEX = re.compile(r"(?<!\\)\(\?P<(\w+)>")
+_BACKREF_REGEX = re.compile(r"(?<!\\)\(\?P=(\w+)\)")
+
+
+def _strip_groups(expression: str, prefix: str) -> str:
+    # Capturing groups make the regex engine save state on each attempt,
+    # which is very slow on large alternations. Parameters are extracted
+    # by the route afterwards, so groups are only kept when referenced
+    # by a backreference, and renamed to be unique.
+    referenced = set(_BACKREF_REGEX.findall(expression))
+
+    def replace_group(m):
+        name = m.group(1)
+        if name in referenced:
+            return f"(?P<{prefix}{name}>"
+        return "(?:"
+
+    expression = _GROUP_REGEX.sub(replace_group, expression)
+    return _BACKREF_REGEX.sub(
+        lambda m: f"(?P={prefix}{m.group(1)})", expression
+    )
+
+
+class RouteRegex:
+    """Routes compiled into a single alternation regular expression.
+
+    Each route pattern becomes one alternative of the expression, in
+    registration order, so that one regex match selects the first matching
+    route. Each alternative ends with an empty named group which identifies
+    the route. Its parameters are then extracted using the route's own
+    pattern.
+
+    # Parameters
+    routes (iterable of Route):
+        Routes in the order in which they should be tried.
+    """
+
+    def __init__(self, routes: Iterable[Route] = ()):
+        self._routes: List[Route] = []
+        self._groups: Dict[str, Route] = {}
+        self._regex: Optional[Pattern] = None
+        for route in routes:
+            self.insert(route)
+
+    def insert(self, route: Route):
+        """Add a route, to be tried after the ones already inserted."""
+        self._routes.append(route)
+        self._regex = None
+
+    def _compile(self) -> Pattern:
+        self._groups = {}
+        alternatives = []
+        flags = 0
+        for index, route in enumerate(self._routes):
+            name = f"r{index}"
+            pattern = route.compiled_pattern
+            expression = _strip_groups(pattern.expression, prefix=name + "_")
+            alternatives.append(f"{expression}$(?P<{name}>)")
+            self._groups[name] = route
+            flags |= pattern.flags
+        return re.compile("^(?:" + "|".join(alternatives) + ")", flags)
+
+    def match(self, path: str) -> Optional[Tuple[Route, dict]]:
+        """Find the first route matching the given path.
+
+        # Returns
+        match (tuple or None):
+            A `(route, params)` tuple, or `None` if no route matched.
+        """
+        if not self._routes:
+            return None
+        if self._regex is None:
+            self._regex = self._compile()
+        match = self._regex.match(path)
+        if match is None:
+            return None
+        route = self._groups[match.lastgroup]
+        return route, route.parse(path)
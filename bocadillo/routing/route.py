@@ -1,9 +1,8 @@
-from http import HTTPStatus
-from typing import Optional, List
+from typing import FrozenSet, Optional, List
 
-from parse import parse
-
-from ..exceptions import HTTPError
+from .pattern import RoutePattern
+from ..constants import ALL_HTTP_METHODS
+from ..executors import Executor
 from ..view import AsyncView
 
 
@@ -14,16 +13,99 @@ class Route:
     """
 
     def __init__(
-        self, pattern: str, view: AsyncView, methods: List[str], name: str
+        self,
+        pattern: str,
+        view: AsyncView,
+        methods: List[str],
+        name: str,
+        conditional: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        single_flight: bool = False,
+        executor: Optional[Executor] = None,
+        inline: Optional[bool] = None,
     ):
+        assert not (
+            inline and executor is not None
+        ), "a route cannot be both inline and have an executor"
         self._pattern = pattern
+        self._compiled_pattern = RoutePattern(pattern)
         self._view = view
-        self._methods = methods
+        self._methods: FrozenSet[str] = frozenset(methods)
+        self._allow = ", ".join(
+            method for method in ALL_HTTP_METHODS if method in self._methods
+        )
         self._name = name
+        self._conditional = conditional
+        self._cache_ttl = cache_ttl
+        self._single_flight = single_flight
+        self._executor = executor
+        self._inline = inline
+
+    @property
+    def pattern(self) -> str:
+        """The route's URL pattern."""
+        return self._pattern
+
+    @property
+    def compiled_pattern(self) -> RoutePattern:
+        """The route's URL pattern, compiled."""
+        return self._compiled_pattern
+
+    @property
+    def name(self) -> str:
+        """The route's name."""
+        return self._name
+
+    @property
+    def methods(self) -> FrozenSet[str]:
+        """The set of HTTP methods supported by the route."""
+        return self._methods
+
+    @property
+    def conditional(self) -> Optional[bool]:
+        """Whether the route sends conditional responses.
+
+        `None` means the application's setting is used.
+        """
+        return self._conditional
+
+    @property
+    def cache_ttl(self) -> Optional[float]:
+        """How long responses of the route are cached, in seconds.
+
+        `None` means responses are not cached.
+        """
+        return self._cache_ttl
+
+    @property
+    def single_flight(self) -> bool:
+        """Whether identical concurrent `GET` requests share a response."""
+        return self._single_flight
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """The executor of the route's synchronous views and hooks.
+
+        `None` means the application's executor is used.
+        """
+        return self._executor
+
+    @property
+    def inline(self) -> Optional[bool]:
+        """Whether synchronous views and hooks run on the event loop.
+
+        `None` means the application's setting is used.
+        """
+        return self._inline
+
+    @property
+    def allow(self) -> str:
+        """The value of the `Allow` header for this route."""
+        return self._allow
 
     def url(self, **kwargs) -> str:
         """Return full path for the given route parameters."""
-        return self._pattern.format(**kwargs)
+        return self._compiled_pattern.url(**kwargs)
 
     def parse(self, path: str) -> Optional[dict]:
         """Parse an URL path against the route's URL pattern.
@@ -42,14 +124,7 @@ class Route:
         >>> route.parse("/john")
         None
         """
-        result = parse(self._pattern, path)
-        if result is not None:
-            return result.named
-        return None
-
-    def raise_for_method(self, request):
-        if request.method not in self._methods:
-            raise HTTPError(status=HTTPStatus.METHOD_NOT_ALLOWED)
+        return self._compiled_pattern.parse(path)
 
     async def __call__(self, request, response, **kwargs) -> None:
         await self._view(request, response, **kwargs)
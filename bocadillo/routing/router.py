@@ -2,16 +2,24 @@
 import inspect
 from functools import partial
 from http import HTTPStatus
-from typing import Dict, List, Tuple, Optional, NamedTuple
+from typing import Dict, List, Tuple, Optional, NamedTuple, Union
 
+from .cache import MISSING, RouteCache, RouteCacheInfo
 from .checks import check_route
+from .pattern import UrlBuilder
+from .regex import RouteRegex
 from .route import Route
+from .tree import RouteTree, get_static_prefix
 from ..compat import camel_to_snake
 from ..constants import ALL_HTTP_METHODS
 from ..exceptions import HTTPError
+from ..executors import Executor
 from ..view import create_async_view, View
 
 
+ENGINES = {"tree": RouteTree, "regex": RouteRegex}
+
+
 class RouteMatch(NamedTuple):
     """Represents the result of a successful route match."""
 
@@ -29,10 +37,43 @@ def _ensure_head_if_get(view: View, methods: List[str]) -> None:
 
 
 class Router:
-    """A collection of routes."""
-
-    def __init__(self):
+    """A collection of routes.
+
+    # Parameters
+    cache_size (int):
+        If given, matches of up to this many URL paths are kept
+        in an LRU cache. Disabled by default.
+    not_found_cache_size (int):
+        Maximum number of URL paths that did not match any route to keep
+        in the cache. Only used if `cache_size` is given.
+        Defaults to `cache_size`.
+    engine (str):
+        How routes with parameters are matched. Either `"tree"`
+        (a prefix tree of URL path segments) or `"regex"` (a single
+        regular expression combining all route patterns).
+        Defaults to `"tree"`.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = None,
+        not_found_cache_size: int = None,
+        engine: str = "tree",
+    ):
+        assert engine in ENGINES, (
+            f"Unknown routing engine: '{engine}' "
+            f"(available: {', '.join(ENGINES)})"
+        )
+        self._engine_class = ENGINES[engine]
         self._routes: Dict[str, Route] = {}
+        self._url_builders: Dict[str, UrlBuilder] = {}
+        self._matcher: Optional[Union[RouteTree, RouteRegex]] = None
+        self._static_routes: Dict[str, Route] = {}
+        self._cache: Optional[RouteCache] = None
+        if cache_size is not None:
+            self._cache = RouteCache(
+                maxsize=cache_size, not_found_maxsize=not_found_cache_size
+            )
 
     def add_route(
         self,
@@ -42,6 +83,11 @@ class Router:
         methods: List[str] = None,
         name: str = None,
         namespace: str = None,
+        conditional: bool = None,
+        cache_ttl: float = None,
+        single_flight: bool = False,
+        executor: Executor = None,
+        inline: bool = None,
     ):
         """Build and register a route."""
         if methods is None:
@@ -74,8 +120,20 @@ class Router:
         check_route(pattern, view, methods)
         view = create_async_view(view)
 
-        route = Route(pattern=pattern, view=view, methods=methods, name=name)
+        route = Route(
+            pattern=pattern,
+            view=view,
+            methods=methods,
+            name=name,
+            conditional=conditional,
+            cache_ttl=cache_ttl,
+            single_flight=single_flight,
+            executor=executor,
+            inline=inline,
+        )
         self._routes[name] = route
+        self._url_builders[name] = route.compiled_pattern.url_builder
+        self._matcher = None
 
         return route
 
@@ -83,12 +141,65 @@ class Router:
         """Register a route by decorating a view."""
         return partial(self.add_route, *args, **kwargs)
 
+    def _compile(self):
+        # Routes without parameters are indexed by their exact path,
+        # unless a route registered before them would match that path.
+        # All others go to the matching engine.
+        tree = RouteTree()
+        dynamic_routes: List[Route] = []
+        static_routes: Dict[str, Route] = {}
+        for route in self._routes.values():
+            path, is_static = get_static_prefix(route.pattern)
+            if is_static and tree.match(path) is None:
+                static_routes.setdefault(path.lower(), route)
+            else:
+                tree.insert(route)
+                dynamic_routes.append(route)
+        self._static_routes = static_routes
+        if self._engine_class is RouteTree:
+            self._matcher = tree
+        else:
+            self._matcher = self._engine_class(dynamic_routes)
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self) -> Optional[RouteCacheInfo]:
+        """Return statistics about the route cache, if enabled."""
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
     def match(self, path: str) -> Optional[RouteMatch]:
-        for pattern, route in self._routes.items():
-            params = route.parse(path)
-            if params is not None:
-                return RouteMatch(route=route, params=params)
-        return None
+        """Find the first route matching the given URL path."""
+        # Routes are compiled lazily so that registering many routes
+        # at startup does not recompile them each time.
+        if self._matcher is None:
+            self._compile()
+
+        route = self._static_routes.get(path.lower())
+        if route is not None:
+            return RouteMatch(route=route, params={})
+
+        cache = self._cache
+        if cache is None:
+            result = self._matcher.match(path)
+        else:
+            result = cache.get(path)
+            if result is MISSING:
+                result = self._matcher.match(path)
+                cache.set(path, result)
+
+        if result is None:
+            return None
+        route, params = result
+        # Params are copied so that cached values cannot be altered.
+        return RouteMatch(route=route, params=dict(params))
+
+    def get_url_builder_or_404(self, name: str) -> UrlBuilder:
+        try:
+            return self._url_builders[name]
+        except KeyError as e:
+            raise HTTPError(HTTPStatus.NOT_FOUND.value) from e
 
     def get_route_or_404(self, name: str) -> Route:
         try:
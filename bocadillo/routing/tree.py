@@ -0,0 +1,96 @@
+"""A segment-based prefix tree of routes."""
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .route import Route
+
+
+def get_static_prefix(pattern: str) -> Tuple[str, bool]:
+    """Return the literal text before the first parameter of a pattern.
+
+    # Returns
+    result (tuple):
+        A `(prefix, is_static)` tuple, where `is_static` is `True` if
+        the pattern does not define any route parameter.
+    """
+    prefix = ""
+    for literal, field_name, _, _ in Formatter().parse(pattern):
+        prefix += literal
+        if field_name is not None:
+            return prefix, False
+    return prefix, True
+
+
+def _get_segments(pattern: str) -> List[str]:
+    # Only segments that are entirely known before the first parameter
+    # can be used as keys. Matching is case-insensitive, as in `parse`.
+    prefix, is_static = get_static_prefix(pattern)
+    if not is_static:
+        prefix = prefix[: prefix.rfind("/")]
+    return prefix.lower().split("/")[1:]
+
+
+class _Node:
+    """A node of the route tree."""
+
+    __slots__ = ("children", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.routes: List[Tuple[int, Route]] = []
+
+
+class RouteTree:
+    """A prefix tree of routes, keyed by URL path segments.
+
+    Each route is stored under the segments of the literal path prefix
+    of its pattern. Matching an URL path only considers routes found along
+    the path's segments, which makes the lookup cost depend on the depth
+    of the path instead of the total number of routes.
+
+    Routes are tried in registration order, so that the first matching
+    route wins.
+
+    # Parameters
+    routes (iterable of Route):
+        Routes in the order in which they should be tried.
+    """
+
+    def __init__(self, routes: Iterable[Route] = ()):
+        self._root = _Node()
+        self._size = 0
+        for route in routes:
+            self.insert(route)
+
+    def insert(self, route: Route):
+        """Add a route, to be tried after the ones already inserted."""
+        node = self._root
+        for segment in _get_segments(route.pattern):
+            node = node.children.setdefault(segment, _Node())
+        node.routes.append((self._size, route))
+        self._size += 1
+
+    def candidates(self, path: str) -> List[Route]:
+        """Return routes that may match the given path, in order."""
+        node = self._root
+        found = list(node.routes)
+        for segment in path.lower().split("/")[1:]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            found += node.routes
+        found.sort(key=lambda item: item[0])
+        return [route for _, route in found]
+
+    def match(self, path: str) -> Optional[Tuple[Route, dict]]:
+        """Find the first route matching the given path.
+
+        # Returns
+        match (tuple or None):
+            A `(route, params)` tuple, or `None` if no route matched.
+        """
+        for route in self.candidates(path):
+            params = route.parse(path)
+            if params is not None:
+                return route, params
+        return None
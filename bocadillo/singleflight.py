@@ -0,0 +1,127 @@
+"""Coalescing of identical concurrent requests (a.k.a. single-flight)."""
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .caching import get_vary
+from .headers import Headers
+from .request import Request
+from .response import Response
+
+RouteCall = Callable[[Request, Response], Awaitable[Response]]
+
+
+class SharedResponse(NamedTuple):
+    """A response computed for one request and shared with others."""
+
+    status_code: int
+    headers: Headers
+    body: bytes
+    # Values of the request headers listed in the response's `Vary` header.
+    vary: Tuple[Tuple[str, Optional[str]], ...]
+
+    @classmethod
+    def create(cls, req: Request, res: Response) -> Optional["SharedResponse"]:
+        """Build a shared response, or return `None` if it must not be shared.
+
+        Streamed responses, responses that set cookies, and responses
+        varying on all request headers (`Vary: *`) are not shared.
+        """
+        if not isinstance(res, Response):  # e.g. a redirection
+            return None
+        if not isinstance(res.content, (str, bytes)):
+            return None
+        if "set-cookie" in res.headers:
+            return None
+        vary = get_vary(res.headers)
+        if "*" in vary:
+            return None
+        if isinstance(res.content, str):
+            res.content = res.content.encode("utf-8")
+        return cls(
+            status_code=res.status_code,
+            headers=res.headers.copy(),
+            body=res.content,
+            vary=tuple((name, req.headers.get(name)) for name in vary),
+        )
+
+    def matches(self, req: Request) -> bool:
+        """Return whether the response can be sent in reply to `req`."""
+        return all(req.headers.get(name) == value for name, value in self.vary)
+
+    def apply(self, res: Response):
+        res.status_code = self.status_code
+        res.headers = self.headers.copy()
+        res.content = self.body
+
+
+class SingleFlight:
+    """Registry of in-flight computations of responses.
+
+    While the response to a request is being computed, identical requests
+    wait for it instead of computing it again. Each of them gets a copy
+    of the response, which it can modify independently.
+
+    Requests are identical if they are `GET` requests to the same route
+    with the same route parameters, query string, `Authorization` and
+    `Cookie` headers, and if the request headers listed in the `Vary`
+    header of the response have the same values.
+
+    # Parameters
+    timeout (float):
+        How long a request waits for an in-flight computation, in seconds,
+        before computing the response itself.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    @staticmethod
+    def key(req: Request, route_name: str, params: dict) -> tuple:
+        return (
+            route_name,
+            tuple(sorted(params.items())),
+            req.url.query,
+            req.headers.get("authorization"),
+            req.headers.get("cookie"),
+        )
+
+    async def run(
+        self, key: Hashable, req: Request, res: Response, call: RouteCall
+    ) -> Response:
+        """Compute the response to a request, or wait for an identical one.
+
+        If the in-flight computation fails, times out or returns a response
+        that cannot be shared, the response is computed by calling `call`.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            try:
+                shared = await asyncio.wait_for(
+                    asyncio.shield(flight), self.timeout
+                )
+            except asyncio.TimeoutError:
+                shared = None
+            if shared is not None and shared.matches(req):
+                shared.apply(res)
+                return res
+            return await call(req, res)
+
+        flight = asyncio.get_event_loop().create_future()
+        self._flights[key] = flight
+        shared = None
+        try:
+            res = await call(req, res)
+            shared = SharedResponse.create(req, res)
+            return res
+        finally:
+            del self._flights[key]
+            flight.set_result(shared)
@@ -1,9 +1,10 @@
 import asyncio
 import inspect
+from types import MappingProxyType
 from typing import Callable, Union, Coroutine
 
-from .compat import call_async
 from .constants import ALL_HTTP_METHODS
+from .executors import run_sync
 from .request import Request
 from .response import Response
 
@@ -43,25 +44,38 @@ def create_async_view(view: View) -> AsyncView:
     if asyncio.iscoroutinefunction(view):
         return view
     elif inspect.isfunction(view):
-
-        async def callable_view(req, res, **kwargs):
-            await call_async(view, req, res, sync=True, **kwargs)
-
-        return callable_view
+        return _from_function(view)
     else:
         return _from_class_instance(view)
 
 
-def _from_class_instance(view: ClassBasedView):
-    def _find_for_method(method: str):
-        try:
-            return getattr(view, "handle")
-        except AttributeError:
-            return getattr(view, method.lower())
+def _from_function(view: Callable) -> AsyncView:
+    if asyncio.iscoroutinefunction(view):
+        return view
+
+    async def callable_view(req, res, **kwargs):
+        await run_sync(res.executor, view, req, res, **kwargs)
+
+    return callable_view
+
+
+def _from_class_instance(view: ClassBasedView) -> AsyncView:
+    # Each HTTP method is resolved to an async view once, here, so that
+    # dispatching a request is a single lookup. Views that are sync
+    # are wrapped once as well.
+    if hasattr(view, "handle"):
+        handle = _from_function(view.handle)
+        views = {method: handle for method in ALL_HTTP_METHODS}
+    else:
+        views = {
+            method: _from_function(getattr(view, method.lower()))
+            for method in ALL_HTTP_METHODS
+            if hasattr(view, method.lower())
+        }
+    views = MappingProxyType(views)
 
     async def callable_view(req, res, **kwargs):
-        view_ = _find_for_method(req.method)
-        await call_async(view_, req, res, **kwargs)
+        await views[req.method](req, res, **kwargs)
 
     return callable_view
 
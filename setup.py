@@ -24,7 +24,6 @@ setuptools.setup(
         "whitenoise",
         "requests",
         "parse",
-        "async_generator",
     ],
     url="https://github.com/bocadilloproject/bocadillo",
     license="MIT",
@@ -17,6 +17,12 @@ def builder(api: API):
     return RouteBuilder(api)
 
 
+@pytest.fixture
+def calls() -> list:
+    """A list that views can append to, to count how often they are called."""
+    return []
+
+
 class TemplateWrapper(NamedTuple):
     name: str
     context: dict
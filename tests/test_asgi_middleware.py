@@ -14,3 +14,38 @@ def test_if_asgi_middleware_is_applied():
     response = api.client.get("/", headers={"Accept-Encoding": "gzip"})
     assert response.status_code == 200
     assert response.headers["content-encoding"] == "gzip"
+
+
+def test_asgi_middleware_is_instantiated_once(api: API):
+    instances = 0
+
+    class Counter:
+        def __init__(self, app):
+            nonlocal instances
+            instances += 1
+            self.app = app
+
+        def __call__(self, scope):
+            return self.app(scope)
+
+    api.add_asgi_middleware(Counter)
+
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    api.client.get("/")
+    api.client.get("/")
+    assert instances == 1
+
+
+def test_asgi_middleware_added_after_a_request_is_applied(api: API):
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    api.client.get("/")
+    api.add_asgi_middleware(GZipMiddleware, minimum_size=0)
+
+    response = api.client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
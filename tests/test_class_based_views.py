@@ -40,3 +40,35 @@ def test_if_handle_is_implemented_then_bypasses_other_methods(api: API):
     response = api.client.get("/")
     assert response.status_code == 200
     assert response.text == "Handle!"
+
+
+def test_sync_and_async_methods(api: API):
+    @api.route("/")
+    class Index:
+        def get(self, req, res):
+            res.text = "Get!"
+
+        async def post(self, req, res):
+            res.text = "Post!"
+
+    assert api.client.get("/").text == "Get!"
+    assert api.client.post("/").text == "Post!"
+    assert api.client.head("/").status_code == 200
+
+
+def test_methods_are_resolved_when_route_is_registered(api: API):
+    lookups = []
+
+    @api.route("/")
+    class Index:
+        def __getattribute__(self, name):
+            lookups.append(name)
+            return super().__getattribute__(name)
+
+        async def get(self, req, res):
+            res.text = "Get!"
+
+    lookups.clear()
+    for _ in range(3):
+        assert api.client.get("/").text == "Get!"
+    assert lookups == []
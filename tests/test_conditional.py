@@ -0,0 +1,195 @@
+import pytest
+
+from bocadillo import API
+from bocadillo.conditional import (
+    etag_matches,
+    if_range_matches,
+    make_etag,
+    not_modified_since,
+)
+
+
+@pytest.fixture
+def conditional_api():
+    return API(enable_conditional=True)
+
+
+def test_etag_is_generated(conditional_api: API):
+    @conditional_api.route("/")
+    async def index(req, res):
+        res.media = {"message": "hello"}
+
+    response = conditional_api.client.get("/")
+    assert response.status_code == 200
+    assert response.headers["etag"] == make_etag(response.content)
+
+
+def test_not_modified(conditional_api: API):
+    @conditional_api.route("/")
+    async def index(req, res):
+        res.media = {"message": "hello"}
+        res.headers["cache-control"] = "max-age=60"
+
+    etag = conditional_api.client.get("/").headers["etag"]
+    response = conditional_api.client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "max-age=60"
+    assert "content-type" not in response.headers
+
+
+def test_modified(conditional_api: API):
+    @conditional_api.route("/")
+    async def index(req, res):
+        res.media = {"message": "hello"}
+
+    response = conditional_api.client.get(
+        "/", headers={"If-None-Match": '"outdated"'}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"message": "hello"}
+
+
+def test_disabled_by_default(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.text = "hello"
+
+    response = api.client.get("/")
+    assert "etag" not in response.headers
+
+
+def test_enable_per_route(api: API):
+    @api.route("/", conditional=True)
+    async def index(req, res):
+        res.text = "hello"
+
+    etag = api.client.get("/").headers["etag"]
+    response = api.client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_disable_per_route(conditional_api: API):
+    @conditional_api.route("/", conditional=False)
+    async def index(req, res):
+        res.text = "hello"
+
+    assert "etag" not in conditional_api.client.get("/").headers
+
+
+def test_only_ok_responses_to_safe_methods(conditional_api: API):
+    @conditional_api.route("/", methods=["get", "post"])
+    async def index(req, res):
+        res.text = "hello"
+        if req.method == "POST":
+            res.status_code = 201
+
+    response = conditional_api.client.post("/", headers={"If-None-Match": "*"})
+    assert response.status_code == 201
+    assert "etag" not in response.headers
+
+
+def test_view_can_skip_rendering(conditional_api: API):
+    rendered = 0
+
+    @conditional_api.route("/")
+    async def index(req, res):
+        nonlocal rendered
+        res.headers["etag"] = '"v1"'
+        res.headers["last-modified"] = "Mon, 01 Jan 2018 00:00:00 GMT"
+        if res.fresh:
+            return
+        rendered += 1
+        res.text = "hello"
+
+    response = conditional_api.client.get("/")
+    assert response.headers["etag"] == '"v1"'
+    assert response.text == "hello"
+
+    response = conditional_api.client.get(
+        "/", headers={"If-None-Match": '"v1"'}
+    )
+    assert response.status_code == 304
+    response = conditional_api.client.get(
+        "/", headers={"If-Modified-Since": "Tue, 02 Jan 2018 00:00:00 GMT"}
+    )
+    assert response.status_code == 304
+    assert rendered == 1
+
+
+def test_stream_with_precomputed_etag(conditional_api: API):
+    @conditional_api.route("/")
+    async def index(req, res):
+        res.headers["etag"] = '"v1"'
+        res.stream(["hello"])
+
+    response = conditional_api.client.get(
+        "/", headers={"If-None-Match": '"v1"'}
+    )
+    assert response.status_code == 304
+    assert not response.content
+
+
+def test_file(conditional_api: API, tmpdir):
+    file = tmpdir.join("hello.txt")
+    file.write("hello")
+
+    @conditional_api.route("/")
+    async def index(req, res):
+        res.file(str(file))
+
+    response = conditional_api.client.get("/")
+    assert response.text == "hello"
+    response = conditional_api.client.get(
+        "/", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "if_none_match, etag, expected",
+    [
+        ('"a"', '"a"', True),
+        ('W/"a"', '"a"', True),
+        ('"b", W/"a"', 'W/"a"', True),
+        ("*", '"a"', True),
+        ('"b"', '"a"', False),
+    ],
+)
+def test_etag_matches(if_none_match, etag, expected):
+    assert etag_matches(if_none_match, etag) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        ("Mon, 01 Jan 2018 00:00:00 GMT", True),
+        ("Sun, 31 Dec 2017 00:00:00 GMT", False),
+        ("not a date", False),
+    ],
+)
+def test_not_modified_since(if_modified_since, expected):
+    last_modified = "Mon, 01 Jan 2018 00:00:00 GMT"
+    assert not_modified_since(if_modified_since, last_modified) is expected
+
+
+@pytest.mark.parametrize(
+    "if_range, expected",
+    [
+        ('"a"', True),
+        (' "a" ', True),
+        ('W/"a"', False),
+        ('"b"', False),
+        ("Mon, 01 Jan 2018 00:00:00 GMT", True),
+        ("Sun, 31 Dec 2017 00:00:00 GMT", False),
+    ],
+)
+def test_if_range_matches(if_range, expected):
+    headers = {"etag": '"a"', "last-modified": "Mon, 01 Jan 2018 00:00:00 GMT"}
+    assert if_range_matches(if_range, headers) is expected
+
+
+def test_if_range_does_not_match_weak_etags():
+    assert not if_range_matches('W/"a"', {"etag": 'W/"a"'})
+    assert not if_range_matches('"a"', {})
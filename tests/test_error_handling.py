@@ -89,3 +89,42 @@ def test_builtin_handlers(api: API, handler, check_response):
     assert response.status_code == 403
     print(response.text)
     assert check_response(response)
+
+
+def test_handler_of_closest_base_class_is_used(api: API):
+    @api.error_handler(LookupError)
+    def on_lookup_error(req, res, exc):
+        res.text = "lookup"
+
+    @api.error_handler(Exception)
+    def on_exception(req, res, exc):
+        res.text = "exception"
+
+    @api.route("/key")
+    def key(req, res):
+        raise KeyError
+
+    @api.route("/value")
+    def value(req, res):
+        raise ValueError
+
+    assert api.client.get("/key").text == "lookup"
+    assert api.client.get("/value").text == "exception"
+
+
+def test_handler_registered_after_a_request_is_used(api: API):
+    @api.error_handler(Exception)
+    def on_exception(req, res, exc):
+        res.text = "exception"
+
+    @api.route("/")
+    def index(req, res):
+        raise KeyError
+
+    assert api.client.get("/").text == "exception"
+
+    @api.error_handler(KeyError)
+    def on_key_error(req, res, exc):
+        res.text = "key"
+
+    assert api.client.get("/").text == "key"
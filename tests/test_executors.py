@@ -0,0 +1,451 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from bocadillo import API, Executor, Middleware, Recipe
+from bocadillo.executors import AdaptiveExecutor, ExecutorSaturated, run_sync
+from tests.utils import asgi_request, make_scope
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+def test_api_has_a_default_executor(api: API):
+    assert isinstance(api.executor, Executor)
+
+
+def test_sync_view_runs_in_api_executor():
+    api = API(executor=Executor(max_workers=2, name="app"))
+
+    @api.route("/")
+    def index(req, res):
+        res.text = _thread_name()
+
+    response = api.client.get("/")
+    assert response.text.startswith("app")
+    metrics = api.executor.metrics()
+    assert metrics.completed == 1
+    assert metrics.active == 0
+    assert metrics.queued == 0
+
+
+def test_async_view_does_not_use_executor(api: API):
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    api.client.get("/")
+    assert api.executor.metrics().completed == 0
+
+
+def test_route_executor(api: API):
+    reports = Executor(max_workers=1, name="reports")
+
+    @api.route("/reports", executor=reports)
+    def generate(req, res):
+        res.text = _thread_name()
+
+    @api.route("/")
+    def index(req, res):
+        res.text = _thread_name()
+
+    assert api.client.get("/reports").text.startswith("reports")
+    assert not api.client.get("/").text.startswith("reports")
+    assert reports.metrics().completed == 1
+    assert api.executor.metrics().completed == 1
+
+
+def test_class_based_view_methods_run_in_route_executor(api: API):
+    pool = Executor(max_workers=1, name="pool")
+
+    @api.route("/", executor=pool)
+    class Index:
+        def get(self, req, res):
+            res.text = _thread_name()
+
+    assert api.client.get("/").text.startswith("pool")
+
+
+def test_hooks_run_in_route_executor(api: API):
+    pool = Executor(max_workers=1, name="pool")
+    threads = []
+
+    def before(req, res, params):
+        threads.append(_thread_name())
+
+    def after(req, res, params):
+        threads.append(_thread_name())
+
+    @api.before(before)
+    @api.after(after)
+    @api.route("/", executor=pool)
+    async def index(req, res):
+        pass
+
+    api.client.get("/")
+    assert len(threads) == 2
+    assert all(name.startswith("pool") for name in threads)
+
+
+def test_middleware_callbacks_run_in_api_executor():
+    api = API(executor=Executor(name="app"))
+    threads = []
+
+    class ThreadMiddleware(Middleware):
+        def before_dispatch(self, req):
+            threads.append(_thread_name())
+
+        def after_dispatch(self, req, res):
+            threads.append(_thread_name())
+
+    api.add_middleware(ThreadMiddleware)
+
+    @api.route("/", executor=Executor(name="pool"))
+    def index(req, res):
+        pass
+
+    api.client.get("/")
+    assert len(threads) == 2
+    assert all(name.startswith("app") for name in threads)
+
+
+def test_recipe_executor(api: API):
+    pool = Executor(max_workers=1, name="pool")
+    other = Executor(max_workers=1, name="other")
+    numbers = Recipe("numbers", executor=pool)
+
+    @numbers.route("/")
+    def index(req, res):
+        res.text = _thread_name()
+
+    @numbers.route("/other", executor=other)
+    def own(req, res):
+        res.text = _thread_name()
+
+    api.recipe(numbers)
+    assert api.client.get("/numbers/").text.startswith("pool")
+    assert api.client.get("/numbers/other").text.startswith("other")
+
+
+@pytest.mark.asyncio
+async def test_full_executor_rejects_with_503():
+    api = API(executor=Executor(max_workers=1, max_queued=1))
+    release = threading.Event()
+
+    @api.route("/")
+    def index(req, res):
+        release.wait(5)
+
+    tasks = [
+        asyncio.ensure_future(asgi_request(api, make_scope())) for _ in range(2)
+    ]
+    while api.executor.metrics().queued + api.executor.metrics().active < 2:
+        await asyncio.sleep(0.001)
+
+    rejected = await asgi_request(api, make_scope())
+    assert rejected["status"] == 503
+
+    release.set()
+    responses = await asyncio.gather(*tasks)
+    assert all(response["status"] == 200 for response in responses)
+
+    metrics = api.executor.metrics()
+    assert metrics.rejected == 1
+    assert metrics.completed == 2
+    assert metrics.max_wait_time > 0
+    assert metrics.mean_wait_time > 0
+
+
+@pytest.mark.asyncio
+async def test_rejection_can_be_handled():
+    api = API(executor=Executor(max_workers=1, max_queued=0))
+    release = threading.Event()
+
+    @api.error_handler(ExecutorSaturated)
+    def retry_later(req, res, exc):
+        res.status_code = 503
+        res.headers["retry-after"] = "1"
+
+    @api.route("/")
+    def index(req, res):
+        release.wait(5)
+
+    task = asyncio.ensure_future(asgi_request(api, make_scope()))
+    while api.executor.metrics().active < 1:
+        await asyncio.sleep(0.001)
+
+    rejected = await asgi_request(api, make_scope())
+    assert rejected["status"] == 503
+    assert (b"retry-after", b"1") in rejected["headers"]
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_run_sync():
+    executor = Executor(max_workers=1, name="pool")
+    assert (await run_sync(executor, _thread_name)).startswith("pool")
+    assert not (await run_sync(None, _thread_name)).startswith("pool")
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_propagated():
+    executor = Executor(max_workers=1)
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+    assert executor.metrics().completed == 1
+    assert executor.metrics().active == 0
+
+
+def test_invalid_settings():
+    with pytest.raises(AssertionError):
+        Executor(max_workers=0)
+    with pytest.raises(AssertionError):
+        Executor(max_queued=-1)
+
+
+def test_inline_view_runs_on_event_loop_thread(api: API):
+    threads = []
+
+    def before(req, res, params):
+        threads.append(_thread_name())
+
+    @api.before(before)
+    @api.route("/", inline=True)
+    def index(req, res):
+        threads.append(_thread_name())
+        res.media = {"ok": True}
+
+    response = api.client.get("/")
+    assert response.json() == {"ok": True}
+    loop_thread = threads[0]
+    assert threads == [loop_thread, loop_thread]
+    assert not loop_thread.startswith("bocadillo")
+    assert api.executor.metrics().completed == 0
+
+
+def test_inline_class_based_view(api: API):
+    @api.route("/", inline=True)
+    class Index:
+        def get(self, req, res):
+            res.text = _thread_name()
+
+    assert not api.client.get("/").text.startswith("bocadillo")
+    assert api.executor.metrics().completed == 0
+
+
+def test_inline_and_executor_cannot_be_combined(api: API):
+    with pytest.raises(AssertionError):
+
+        @api.route("/", inline=True, executor=Executor())
+        def index(req, res):
+            pass
+
+
+def test_inline_route_of_recipe_with_executor(api: API):
+    numbers = Recipe("numbers", executor=Executor(name="pool"))
+
+    @numbers.route("/", inline=True)
+    def index(req, res):
+        res.text = _thread_name()
+
+    api.recipe(numbers)
+    assert not api.client.get("/numbers/").text.startswith("pool")
+
+
+def test_inline_watchdog_warns_about_blocking_views(caplog):
+    api = API(inline_watchdog=0.001)
+
+    @api.route("/slow", inline=True)
+    def slow(req, res):
+        time.sleep(0.01)
+
+    @api.route("/fast", inline=True)
+    def fast(req, res):
+        pass
+
+    with caplog.at_level(logging.WARNING, logger="bocadillo.executors"):
+        api.client.get("/fast")
+        assert not caplog.records
+        api.client.get("/slow")
+    assert len(caplog.records) == 1
+    assert "slow" in caplog.records[0].getMessage()
+    assert "blocked the event loop" in caplog.records[0].getMessage()
+
+
+def test_inline_watchdog_is_disabled_by_default(api: API, caplog):
+    @api.route("/", inline=True)
+    def slow(req, res):
+        time.sleep(0.01)
+
+    with caplog.at_level(logging.WARNING, logger="bocadillo.executors"):
+        api.client.get("/")
+    assert not caplog.records
+
+
+def test_adaptive_inline_is_disabled_by_default(api: API):
+    @api.route("/")
+    def index(req, res):
+        pass
+
+    api.client.get("/")
+    assert api.sync_placements() == {}
+
+
+def test_adaptive_inline_moves_fast_views_inline():
+    api = API(adaptive_inline=True, executor=Executor(name="pool"))
+
+    @api.route("/")
+    def index(req, res):
+        res.text = _thread_name()
+
+    assert api.client.get("/").text.startswith("pool")
+    for _ in range(20):
+        api.client.get("/")
+    assert not api.client.get("/").text.startswith("pool")
+
+    [placement] = api.sync_placements()["index"]
+    assert placement.inline
+    assert placement.name.endswith("index")
+    assert placement.calls == 22
+    assert placement.estimate < 0.0002
+
+
+def test_adaptive_inline_keeps_blocking_views_in_threads():
+    api = API(adaptive_inline=True, executor=Executor(name="pool"))
+
+    @api.route("/")
+    def index(req, res):
+        time.sleep(0.001)
+        res.text = _thread_name()
+
+    for _ in range(25):
+        assert api.client.get("/").text.startswith("pool")
+    [placement] = api.sync_placements()["index"]
+    assert not placement.inline
+    assert placement.estimate >= 0.001
+
+
+def test_adaptive_inline_applies_to_hooks():
+    api = API(adaptive_inline=True)
+
+    def before(req, res, params):
+        pass
+
+    @api.before(before)
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    for _ in range(20):
+        api.client.get("/")
+    [placement] = api.sync_placements()["index"]
+    assert placement.name.endswith("before")
+    assert placement.inline
+
+
+def test_adaptive_inline_respects_route_inline_option():
+    api = API(adaptive_inline=True, executor=Executor(name="pool"))
+
+    @api.route("/thread", inline=False)
+    def thread(req, res):
+        res.text = _thread_name()
+
+    @api.route("/inline", inline=True)
+    def inline(req, res):
+        res.text = _thread_name()
+
+    for _ in range(25):
+        assert api.client.get("/thread").text.startswith("pool")
+    assert not api.client.get("/inline").text.startswith("pool")
+    assert api.sync_placements() == {}
+
+
+def test_adaptive_inline_uses_route_executor():
+    api = API(adaptive_inline=True)
+
+    @api.route("/", executor=Executor(name="reports"))
+    def index(req, res):
+        time.sleep(0.001)
+        res.text = _thread_name()
+
+    assert api.client.get("/").text.startswith("reports")
+    assert "index" in api.sync_placements()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_executor_moves_slow_functions_back_to_threads():
+    executor = AdaptiveExecutor(
+        Executor(name="pool"), threshold=0.001, min_calls=3
+    )
+    delay = 0
+
+    def func():
+        time.sleep(delay)
+        return _thread_name()
+
+    for _ in range(3):
+        assert (await executor.run(func)).startswith("pool")
+    assert not (await executor.run(func)).startswith("pool")
+
+    delay = 0.01
+    await executor.run(func)  # Measured while run inline.
+    assert (await executor.run(func)).startswith("pool")
+    [placement] = executor.placements()
+    assert not placement.inline
+    assert placement.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_adaptive_executor_measures_failing_calls():
+    executor = AdaptiveExecutor(threshold=0.001, min_calls=1)
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+    [placement] = executor.placements()
+    assert placement.calls == 2
+    assert placement.inline
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_calls_are_dequeued():
+    executor = Executor(max_workers=1, max_queued=2)
+    release = threading.Event()
+
+    active = asyncio.ensure_future(executor.run(release.wait, 5))
+    queued = asyncio.ensure_future(executor.run(release.wait, 5))
+    while executor.metrics().queued < 1:
+        await asyncio.sleep(0.001)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await active
+
+    metrics = executor.metrics()
+    assert metrics.queued == 0
+    assert metrics.active == 0
+    assert metrics.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_to_shut_down_executor_are_dequeued():
+    executor = Executor(max_workers=1, max_queued=0)
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        await executor.run(_thread_name)
+    assert executor.metrics().queued == 0
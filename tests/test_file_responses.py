@@ -0,0 +1,248 @@
+import gzip
+
+import pytest
+
+from bocadillo import API
+from bocadillo.files import (
+    ByteRange,
+    RangeNotSatisfiable,
+    content_disposition,
+    parse_range,
+)
+from tests.utils import asgi_request, empty_receive, make_scope
+
+CONTENT = bytes(range(256)) * 40  # 10 KiB
+
+
+@pytest.fixture
+def path(tmpdir):
+    file = tmpdir.join("data.bin")
+    file.write_binary(CONTENT)
+    return str(file)
+
+
+@pytest.fixture
+def file_api(api: API, path):
+    @api.route("/file")
+    async def index(req, res):
+        res.file(path, chunk_size=1000)
+
+    return api
+
+
+def test_send_file(file_api: API):
+    response = file_api.client.get("/file")
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-length"] == str(len(CONTENT))
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "etag" in response.headers
+    assert "last-modified" in response.headers
+
+
+def test_media_type_is_guessed_from_file_name(api: API, tmpdir):
+    file = tmpdir.join("style.css")
+    file.write("h1 {}")
+
+    @api.route("/")
+    async def index(req, res):
+        res.file(str(file))
+
+    response = api.client.get("/")
+    assert response.headers["content-type"] == "text/css"
+    assert response.text == "h1 {}"
+
+
+def test_send_as_attachment(api: API, path):
+    @api.route("/")
+    async def index(req, res):
+        res.file(path, filename="export.csv")
+
+    response = api.client.get("/")
+    assert response.headers["content-type"] == "text/csv"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="export.csv"'
+    )
+
+
+def test_missing_file(api: API):
+    @api.route("/")
+    async def index(req, res):
+        with pytest.raises(FileNotFoundError):
+            res.file("does-not-exist.txt")
+        res.status_code = 404
+
+    assert api.client.get("/").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "range_header, start, end",
+    [
+        ("bytes=0-99", 0, 99),
+        ("bytes=1000-", 1000, len(CONTENT) - 1),
+        ("bytes=-100", len(CONTENT) - 100, len(CONTENT) - 1),
+        ("bytes=10000-99999", 10000, len(CONTENT) - 1),
+    ],
+)
+def test_range_request(file_api: API, range_header, start, end):
+    response = file_api.client.get("/file", headers={"Range": range_header})
+    assert response.status_code == 206
+    assert response.content == CONTENT[start : end + 1]
+    assert response.headers["content-length"] == str(end - start + 1)
+    assert (
+        response.headers["content-range"]
+        == f"bytes {start}-{end}/{len(CONTENT)}"
+    )
+
+
+@pytest.mark.parametrize(
+    "range_header", ["bytes=0-1,5-6", "items=0-1", "bytes=5-1", "bytes=a-b"]
+)
+def test_unsupported_ranges_are_ignored(file_api: API, range_header):
+    response = file_api.client.get("/file", headers={"Range": range_header})
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_range_not_satisfiable(file_api: API):
+    response = file_api.client.get(
+        "/file", headers={"Range": f"bytes={len(CONTENT)}-"}
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+    assert not response.content
+
+
+def test_if_range(file_api: API):
+    etag = file_api.client.get("/file").headers["etag"]
+
+    response = file_api.client.get(
+        "/file", headers={"Range": "bytes=0-9", "If-Range": etag}
+    )
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+
+    response = file_api.client.get(
+        "/file", headers={"Range": "bytes=0-9", "If-Range": '"outdated"'}
+    )
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+@pytest.mark.parametrize(
+    "header, value",
+    [("etag", '"v1"'), ("last-modified", "Mon, 01 Jan 2018 00:00:00 GMT")],
+)
+def test_if_range_uses_validators_set_by_view(api: API, path, header, value):
+    @api.route("/")
+    async def index(req, res):
+        res.headers[header] = value
+        res.file(path)
+
+    response = api.client.get(
+        "/", headers={"Range": "bytes=0-9", "If-Range": value}
+    )
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_send(api: API, path):
+    @api.route("/")
+    async def index(req, res):
+        res.file(path)
+
+    messages = []
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "data": message["file"].read()}
+        messages.append(message)
+
+    scope = make_scope(
+        headers=[(b"range", b"bytes=10-19")],
+        extensions={"http.response.zerocopysend": {}},
+    )
+    await api(scope)(empty_receive, send)
+    start, body = messages
+    assert start["status"] == 206
+    assert body["type"] == "http.response.zerocopysend"
+    assert (body["offset"], body["count"]) == (10, 10)
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_is_not_used_with_gzip(path):
+    api = API(enable_gzip=True, gzip_min_size=0)
+
+    @api.route("/")
+    async def index(req, res):
+        res.file(path)
+
+    scope = make_scope(
+        headers=[(b"accept-encoding", b"gzip")],
+        extensions={"http.response.zerocopysend": {}},
+    )
+    response = await asgi_request(api, scope)
+    assert response["status"] == 200
+    # Files sent through the zero-copy extension would be missing here.
+    assert gzip.decompress(response["body"]) == CONTENT
+
+
+def test_range_is_ignored_with_gzip(path):
+    api = API(enable_gzip=True, gzip_min_size=0)
+
+    @api.route("/")
+    async def index(req, res):
+        res.file(path)
+
+    response = api.client.get(
+        "/", headers={"Range": "bytes=0-99", "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-range" not in response.headers
+    assert "accept-ranges" not in response.headers
+    assert response.content == CONTENT
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("bytes=0-0", ByteRange(0, 0)),
+        ("bytes=-1000", ByteRange(0, 99)),
+        ("bytes = 5-", ByteRange(5, 99)),
+        ("bytes=0-1, 3-4", None),
+        ("bytes=", None),
+    ],
+)
+def test_parse_range(value, expected):
+    assert parse_range(value, size=100) == expected
+
+
+@pytest.mark.parametrize("value", ["bytes=100-", "bytes=-0"])
+def test_parse_unsatisfiable_range(value):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(value, size=100)
+
+
+def test_empty_file(api: API, tmpdir):
+    file = tmpdir.join("empty.txt")
+    file.write("")
+
+    @api.route("/")
+    async def index(req, res):
+        res.file(str(file))
+
+    response = api.client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "0"
+    assert not response.content
+
+
+def test_content_disposition_of_non_latin_names():
+    assert (
+        content_disposition("résumé €.pdf")
+        == "attachment; filename*=utf-8''r%C3%A9sum%C3%A9%20%E2%82%AC.pdf"
+    )
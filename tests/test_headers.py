@@ -0,0 +1,55 @@
+from bocadillo import API
+from bocadillo.headers import Headers, encode_header
+
+
+def test_headers_are_case_insensitive():
+    headers = Headers({"Content-Type": "text/css"})
+    assert headers["content-type"] == "text/css"
+    assert "CONTENT-TYPE" in headers
+    headers["content-TYPE"] = "text/html"
+    assert list(headers.items()) == [("content-type", "text/html")]
+    assert headers.pop("Content-Type") == "text/html"
+    assert not headers
+
+
+def test_headers_can_have_multiple_values():
+    headers = Headers()
+    headers.add("Set-Cookie", "a=1")
+    headers.add("set-cookie", "b=2")
+    assert headers["set-cookie"] == "b=2"
+    assert headers.getlist("set-cookie") == ["a=1", "b=2"]
+    assert headers.raw == [(b"set-cookie", b"a=1"), (b"set-cookie", b"b=2")]
+
+    headers["set-cookie"] = "c=3"
+    assert headers.getlist("set-cookie") == ["c=3"]
+
+
+def test_send_multiple_values(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.headers.add("set-cookie", "a=1")
+        res.headers.add("set-cookie", "b=2")
+
+    response = api.client.get("/")
+    assert response.cookies["a"] == "1"
+    assert response.cookies["b"] == "2"
+
+
+def test_headers_can_be_assigned_a_dict(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.headers = {"X-A": "1"}
+        res.text = "hello"
+
+    response = api.client.get("/")
+    assert response.status_code == 200
+    assert response.headers["x-a"] == "1"
+    assert response.text == "hello"
+
+
+def test_encode_header():
+    assert encode_header("content-type", "text/plain") == (
+        b"content-type",
+        b"text/plain",
+    )
+    assert encode_header("etag", '"abc"') == (b"etag", b'"abc"')
@@ -1,8 +1,10 @@
 import json
+from datetime import date
 
 import pytest
 
 from bocadillo import API, Media
+from bocadillo.media import JSON_BACKENDS, get_json_handler, handle_json
 from bocadillo.exceptions import UnsupportedMediaType
 
 
@@ -42,7 +44,82 @@ def test_use_builtin_media_handlers(api: API, media_type, expected_text):
     response = api.client.get("/")
     assert response.status_code == 200
     assert response.headers["content-type"] == media_type
-    assert response.text == expected_text(data)
+    if media_type == Media.JSON:
+        # Formatting depends on the installed JSON backend.
+        assert response.json() == data
+    else:
+        assert response.text == expected_text(data)
+
+
+@pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+def test_json_backends(backend):
+    if backend != "json":
+        pytest.importorskip(backend)
+    handle = get_json_handler(backend)
+    data = {"message": "hellö", "items": [1, 2.5, None, True]}
+    content = handle(data)
+    if backend != "json":
+        assert isinstance(content, bytes)
+    assert json.loads(content) == data
+
+
+@pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+@pytest.mark.parametrize(
+    "data", [{1: "x"}, {"n": 2 ** 70}, {"n": -2 ** 70}, [2 ** 64]]
+)
+def test_json_backends_accept_what_stdlib_accepts(backend, data):
+    if backend != "json":
+        pytest.importorskip(backend)
+    handle = get_json_handler(backend)
+    assert json.loads(handle(data)) == json.loads(json.dumps(data))
+
+
+def test_json_backends_raise_what_stdlib_raises():
+    for backend in JSON_BACKENDS:
+        try:
+            handle = get_json_handler(backend)
+        except ImportError:
+            continue
+        with pytest.raises(TypeError):
+            handle({"value": object()})
+
+
+def test_int_keys_and_big_ints_in_media(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.media = {1: "x", "n": 2 ** 70}
+
+    response = api.client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {"1": "x", "n": 2 ** 70}
+
+
+def test_json_backend_is_stdlib_by_default(api: API):
+    @api.route("/nan")
+    async def nan(req, res):
+        res.media = {"x": float("nan")}
+
+    @api.route("/date")
+    async def today(req, res):
+        res.media = {"date": date(2019, 1, 1)}
+
+    assert api.client.get("/nan").text == '{"x": NaN}'
+    assert api.client.get("/date").status_code == 500
+
+
+def test_json_backend_can_be_chosen():
+    pytest.importorskip("orjson")
+    api = API(json_backend="orjson")
+
+    @api.route("/")
+    async def index(req, res):
+        res.media = {"x": float("nan"), "date": date(2019, 1, 1)}
+
+    assert api.client.get("/").text == '{"x":null,"date":"2019-01-01"}'
+
+
+def test_json_backend_is_stdlib_if_requested():
+    assert get_json_handler("json") is handle_json
 
 
 @pytest.fixture
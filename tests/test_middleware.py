@@ -142,3 +142,39 @@ def test_middleware_uses_registered_http_error_handler(api: API):
     response = api.client.get("/")
     assert response.status_code == 401
     assert response.text == "Foo"
+
+
+def test_middleware_is_instantiated_once(api: API):
+    instances = 0
+
+    class CountInstances(Middleware):
+        def __init__(self, dispatch, **kwargs):
+            nonlocal instances
+            instances += 1
+            super().__init__(dispatch, **kwargs)
+
+    api.add_middleware(CountInstances)
+
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    api.client.get("/")
+    api.client.get("/")
+    assert instances == 1
+
+
+def test_error_handler_added_after_a_request_is_used(api: API):
+    class NopeMiddleware(Middleware):
+        async def before_dispatch(self, req):
+            raise HTTPError(401)
+
+    api.add_middleware(NopeMiddleware)
+    assert api.client.get("/").text == "401 Unauthorized"
+
+    @api.error_handler(HTTPError)
+    def custom(req, res, exc: HTTPError):
+        res.status_code = exc.status_code
+        res.text = "Foo"
+
+    assert api.client.get("/").text == "Foo"
@@ -1 +1,89 @@
-# TODO
+import pytest
+
+from bocadillo import API
+from bocadillo.mounts import MountTree
+
+
+def _asgi(text: str):
+    def app(scope):
+        async def asgi(receive, send):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [[b"content-type", b"text/plain"]],
+                }
+            )
+            body = f"{text}:{scope['path']}".encode()
+            await send({"type": "http.response.body", "body": body})
+
+        return asgi
+
+    return app
+
+
+def _wsgi(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [f"wsgi:{environ['PATH_INFO']}".encode()]
+
+
+def test_mount_asgi_app(api: API):
+    api.mount("/sub", _asgi("sub"))
+    response = api.client.get("/sub/foo")
+    assert response.status_code == 200
+    assert response.text == "sub:/foo"
+
+
+def test_mount_wsgi_app(api: API):
+    api.mount("/wsgi", _wsgi)
+    response = api.client.get("/wsgi/foo")
+    assert response.status_code == 200
+    assert response.text == "wsgi:/foo"
+
+
+def test_request_for_prefix_is_made_to_mounted_app_root(api: API):
+    api.mount("/sub", _asgi("sub"))
+    assert api.client.get("/sub").text == "sub:/"
+
+
+def test_prefix_only_matches_whole_segments(api: API):
+    api.mount("/sub", _asgi("sub"))
+
+    @api.route("/subway")
+    async def subway(req, res):
+        res.text = "subway"
+
+    assert api.client.get("/subway").text == "subway"
+
+
+def test_longest_prefix_wins(api: API):
+    api.mount("/sub", _asgi("sub"))
+    api.mount("/sub/deeper", _asgi("deeper"))
+    assert api.client.get("/sub/deeper/foo").text == "deeper:/foo"
+    assert api.client.get("/sub/other").text == "sub:/other"
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/static", ("static", "/static")),
+        ("/static/", ("static", "/static")),
+        ("/static/css/app.css", ("static", "/static")),
+        ("/static/admin/app.css", ("admin", "/static/admin")),
+        ("/staticky", None),
+        ("/", None),
+    ],
+)
+def test_mount_tree(path, expected):
+    mounts = MountTree()
+    mounts.add("/static", "static")
+    mounts.add("/static/admin/", "admin")
+    assert mounts.find(path) == expected
+
+
+def test_app_mounted_at_root_matches_everything():
+    mounts = MountTree()
+    mounts.add("/", "root")
+    mounts.add("/foo", "foo")
+    assert mounts.find("/bar") == ("root", "")
+    assert mounts.find("/foo/bar") == ("foo", "/foo")
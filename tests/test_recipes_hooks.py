@@ -46,3 +46,22 @@ def test_on_class_based_view(api: API):
 
         api.recipe(numbers)
         api.client.get("/numbers/real")
+
+
+def test_multiple_hooks(api: API):
+    numbers = Recipe("numbers")
+    calls = []
+
+    def hook(req, res, params, name):
+        calls.append(name)
+
+    @numbers.before(hook, "before 1")
+    @numbers.before(hook, "before 2")
+    @numbers.after(hook, "after")
+    @numbers.route("/real")
+    async def real_numbers(req, res):
+        calls.append("view")
+
+    api.recipe(numbers)
+    api.client.get("/numbers/real")
+    assert calls == ["before 1", "before 2", "view", "after"]
@@ -62,3 +62,29 @@ def test_last_response_setter_called_has_priority(builder):
     response = builder.api.client.get("/")
     assert response.headers["Content-Type"] == "application/json"
     assert response.json() == {"foo": "bar"}
+
+
+def test_content_length_is_set(builder):
+    builder.function_based("/", res={"text": "foo"})
+    response = builder.api.client.get("/")
+    assert response.headers["content-length"] == "3"
+
+
+def test_custom_content_type_is_not_overridden(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.content = "h1 { color: gold; }"
+        res.headers["Content-Type"] = "text/css"
+
+    response = api.client.get("/")
+    assert response.headers["content-type"] == "text/css"
+    assert response.raw.headers.getlist("content-type") == ["text/css"]
+
+
+def test_can_send_bytes(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.content = b"\x00\x01"
+        res.headers["content-type"] = "application/octet-stream"
+
+    assert api.client.get("/").content == b"\x00\x01"
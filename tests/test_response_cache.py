@@ -0,0 +1,176 @@
+import time
+
+import pytest
+
+from bocadillo import API
+from bocadillo.caching import parse_cache_control
+
+
+@pytest.fixture
+def cached_api(api: API, calls):
+    @api.route("/items/{pk}", cache_ttl=60)
+    async def item(req, res, pk):
+        calls.append(pk)
+        res.media = {"pk": pk, "page": req.query_params.get("page")}
+
+    return api
+
+
+def test_responses_are_cached(cached_api: API, calls):
+    first = cached_api.client.get("/items/1")
+    second = cached_api.client.get("/items/1")
+    assert calls == ["1"]
+    assert second.json() == first.json() == {"pk": "1", "page": None}
+    assert second.headers["content-type"] == "application/json"
+    info = cached_api.response_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.size > 0
+
+
+def test_key_includes_params_and_query_string(cached_api: API, calls):
+    cached_api.client.get("/items/1")
+    cached_api.client.get("/items/2")
+    assert cached_api.client.get("/items/1?page=2").json()["page"] == "2"
+    assert calls == ["1", "2", "1"]
+
+
+def test_routes_without_ttl_are_not_cached(api: API, calls):
+    @api.route("/")
+    async def index(req, res):
+        calls.append(None)
+
+    api.client.get("/")
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+def test_hits_skip_hooks(api: API, calls):
+    def before(req, res, params):
+        calls.append("hook")
+
+    @api.before(before)
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        res.text = "hello"
+
+    api.client.get("/")
+    assert api.client.get("/").text == "hello"
+    assert calls == ["hook"]
+
+
+def test_entries_expire(api: API, calls):
+    @api.route("/", cache_ttl=0.05)
+    async def index(req, res):
+        calls.append(None)
+
+    api.client.get("/")
+    time.sleep(0.1)
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+def test_vary(api: API, calls):
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        calls.append(None)
+        res.headers["vary"] = "Accept-Language"
+        res.text = req.headers.get("accept-language", "en")
+
+    for language in ("fr", "de", "fr"):
+        response = api.client.get("/", headers={"Accept-Language": language})
+        assert response.text == language
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "cache_control", ["no-store", "private", "no-cache", "max-age=0"]
+)
+def test_response_cache_control_prevents_caching(
+    api: API, calls, cache_control
+):
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        calls.append(None)
+        res.headers["cache-control"] = cache_control
+
+    api.client.get("/")
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+def test_max_age_overrides_ttl(api: API, calls):
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        calls.append(None)
+        res.headers["cache-control"] = "public, max-age=0"
+
+    api.client.get("/")
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{"Cache-Control": "no-cache"}, {"Authorization": "Bearer token"}],
+)
+def test_request_headers_bypass_cache(cached_api: API, calls, headers):
+    cached_api.client.get("/items/1")
+    cached_api.client.get("/items/1", headers=headers)
+    assert calls == ["1", "1"]
+
+
+@pytest.mark.parametrize("status_code", [201, 404])
+def test_only_ok_responses_are_cached(api: API, calls, status_code):
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        calls.append(None)
+        res.status_code = status_code
+
+    api.client.get("/")
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+def test_responses_setting_cookies_are_not_cached(api: API, calls):
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        calls.append(None)
+        res.headers["set-cookie"] = "session=1"
+
+    api.client.get("/")
+    api.client.get("/")
+    assert len(calls) == 2
+
+
+def test_least_recently_used_responses_are_evicted(calls):
+    api = API(response_cache_max_bytes=2500)
+
+    @api.route("/{pk}", cache_ttl=60)
+    async def index(req, res, pk):
+        calls.append(pk)
+        res.text = "x" * 1000
+
+    for pk in ("1", "2", "1", "3", "1", "2"):
+        api.client.get(f"/{pk}")
+    assert calls == ["1", "2", "3", "2"]
+    assert api.response_cache_info().size <= 2500
+
+
+def test_etag_of_cached_responses():
+    api = API(enable_conditional=True)
+
+    @api.route("/", cache_ttl=60)
+    async def index(req, res):
+        res.text = "hello"
+
+    etag = api.client.get("/").headers["etag"]
+    response = api.client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('Public, max-age=60, x="y"') == {
+        "public": None,
+        "max-age": "60",
+        "x": "y",
+    }
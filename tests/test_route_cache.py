@@ -0,0 +1,81 @@
+from bocadillo import API
+from bocadillo.routing import Router
+
+
+def _view(req, res, x):
+    pass
+
+
+def test_route_cache_is_disabled_by_default(api: API):
+    assert api.route_cache_info() is None
+
+
+def test_route_matches_are_cached():
+    router = Router(cache_size=2)
+    router.add_route(_view, "/items/{x:d}", name="item")
+
+    assert router.match("/items/1").params == {"x": 1}
+    assert router.match("/items/1").params == {"x": 1}
+    info = router.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.size == 1
+
+
+def test_least_recently_used_matches_are_evicted():
+    router = Router(cache_size=2)
+    router.add_route(_view, "/items/{x:d}", name="item")
+
+    router.match("/items/1")
+    router.match("/items/2")
+    router.match("/items/1")
+    router.match("/items/3")  # evicts /items/2
+    assert router.cache_info().size == 2
+
+    router.match("/items/1")
+    assert router.cache_info().hits == 2
+    router.match("/items/2")
+    assert router.cache_info().misses == 4
+
+
+def test_not_found_paths_are_cached_separately():
+    router = Router(cache_size=10, not_found_cache_size=1)
+    router.add_route(_view, "/items/{x:d}", name="item")
+
+    router.match("/items/1")
+    assert router.match("/nope") is None
+    assert router.match("/nope") is None
+    assert router.match("/other") is None
+
+    info = router.cache_info()
+    assert info.not_found_hits == 1
+    assert info.not_found_size == 1
+    assert info.size == 1
+
+
+def test_cache_is_cleared_when_a_route_is_added():
+    router = Router(cache_size=10)
+    router.add_route(_view, "/items/{x:d}", name="item")
+    assert router.match("/other/1") is None
+
+    router.add_route(_view, "/other/{x:d}", name="other")
+    assert router.match("/other/1").route.name == "other"
+
+
+def test_cached_params_cannot_be_altered():
+    router = Router(cache_size=10)
+    router.add_route(_view, "/items/{x:d}", name="item")
+    router.match("/items/1").params["x"] = 2
+    assert router.match("/items/1").params == {"x": 1}
+
+
+def test_route_cache_on_api():
+    api = API(route_cache_size=10)
+
+    @api.route("/greet/{person}")
+    async def greet(req, res, person):
+        res.text = person
+
+    assert api.client.get("/greet/John").text == "John"
+    assert api.client.get("/greet/John").text == "John"
+    assert api.route_cache_info().hits == 1
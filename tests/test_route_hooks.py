@@ -112,3 +112,66 @@ def test_before_does_not_run_if_method_not_allowed(api: API):
 
         response = api.client.put("/foo")
         assert response.status_code == 405
+
+
+def test_multiple_hooks_are_nested_like_decorators(api: API):
+    calls = []
+
+    def hook(name):
+        def hook_function(req, res, params):
+            calls.append(name)
+
+        return hook_function
+
+    @api.before(hook("before 1"))
+    @api.after(hook("after 1"))
+    @api.before(hook("before 2"))
+    @api.after(hook("after 2"))
+    @api.route("/foo")
+    async def foo(req, res):
+        calls.append("view")
+
+    api.client.get("/foo")
+    assert calls == ["before 1", "before 2", "view", "after 2", "after 1"]
+
+
+def test_multiple_hooks_on_method(api: API):
+    calls = []
+
+    async def hook(req, res, params, name):
+        calls.append(name)
+
+    @api.route("/foo")
+    class Foo:
+        @api.before(hook, "before 1")
+        @api.before(hook, "before 2")
+        def get(self, req, res):
+            calls.append("view")
+
+    api.client.get("/foo")
+    assert calls == ["before 1", "before 2", "view"]
+
+
+def test_hook_can_be_async_callable_class(api: API):
+    called = False
+
+    class Hook:
+        async def __call__(self, req, res, params):
+            nonlocal called
+            called = True
+
+    @api.before(Hook())
+    @api.route("/foo")
+    async def foo(req, res):
+        pass
+
+    api.client.get("/foo")
+    assert called
+
+
+def test_routes_without_hooks_have_no_chain(api: API):
+    @api.route("/foo")
+    async def foo(req, res):
+        pass
+
+    assert api.get_hooks().get_chain(foo) is None
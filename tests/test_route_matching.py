@@ -0,0 +1,154 @@
+import pytest
+
+from bocadillo import API
+from bocadillo.routing import Router
+from bocadillo.routing.pattern import RoutePattern
+
+
+def _view(req, res):
+    pass
+
+
+def _param_view(req, res, x):
+    pass
+
+
+def test_first_registered_route_wins(api: API):
+    @api.route("/items/{x}")
+    async def item(req, res, x):
+        res.text = "item"
+
+    @api.route("/items/new")
+    async def new_item(req, res):
+        res.text = "new"
+
+    response = api.client.get("/items/new")
+    assert response.text == "item"
+
+
+def test_routes_registered_after_a_request_are_matched(api: API):
+    @api.route("/foo")
+    async def foo(req, res):
+        pass
+
+    assert api.client.get("/bar").status_code == 404
+
+    @api.route("/bar")
+    async def bar(req, res):
+        pass
+
+    assert api.client.get("/bar").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/", "root"),
+        ("/about", "about"),
+        ("/ABOUT", "about"),
+        ("/about/", "anything"),
+        ("/blog/posts/42", "post"),
+        ("/blog/posts/foo", "anything"),
+        ("/blog/posts/", "anything"),
+        ("/files/a/b/c.txt", "file"),
+        ("/nope", "anything"),
+        ("/nope/nope", "anything"),
+    ],
+)
+@pytest.mark.parametrize("engine", ["tree", "regex"])
+def test_match(path, expected, engine):
+    router = Router(engine=engine)
+    router.add_route(_view, "/", name="root")
+    router.add_route(_view, "/about", name="about")
+    router.add_route(_param_view, "/blog/posts/{x:d}", name="post")
+    router.add_route(_param_view, "/files/{x}", name="file")
+    router.add_route(_param_view, "/{x}", name="anything")
+
+    match = router.match(path)
+    assert match is not None
+    assert match.route.name == expected
+
+
+@pytest.mark.parametrize("engine", ["tree", "regex"])
+def test_if_no_route_matches_then_none(engine):
+    router = Router(engine=engine)
+    router.add_route(_param_view, "/items/{x:d}", name="item")
+    assert router.match("/items/foo") is None
+    assert router.match("/other") is None
+
+
+@pytest.mark.parametrize("engine", ["tree", "regex"])
+def test_params_may_span_multiple_segments(engine):
+    router = Router(engine=engine)
+    router.add_route(_param_view, "/files/{x}", name="file")
+    match = router.match("/files/a/b/c.txt")
+    assert match.params == {"x": "a/b/c.txt"}
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected",
+    [
+        ("/{x}", "/foo", {"x": "foo"}),
+        ("/{x:d}", "/42", {"x": 42}),
+        ("/{x:d}", "/foo", None),
+        ("/{x:w}/{y:d}", "/foo/-1", {"x": "foo", "y": -1}),
+        ("/{x:w}", "/foo bar", None),
+        ("/{x}/{x}", "/foo/foo", {"x": "foo"}),
+        ("/{x}/{x}", "/foo/bar", None),
+    ],
+)
+def test_route_pattern(pattern, path, expected):
+    assert RoutePattern(pattern).parse(path) == expected
+
+
+def test_static_route_registered_first_wins():
+    router = Router()
+    router.add_route(_view, "/items/new", name="new_item")
+    router.add_route(_param_view, "/items/{x}", name="item")
+    assert router.match("/items/new").route.name == "new_item"
+    assert router.match("/items/1").route.name == "item"
+
+
+def test_static_route_with_escaped_braces():
+    router = Router()
+    router.add_route(_view, "/{{braces}}", name="braces")
+    assert router.match("/{braces}").route.name == "braces"
+
+
+def test_regex_engine_supports_repeated_parameters():
+    router = Router(engine="regex")
+    router.add_route(_param_view, "/{x}/{x}", name="twice")
+    router.add_route(_param_view, "/{x:d}", name="number")
+    assert router.match("/foo/foo").params == {"x": "foo"}
+    assert router.match("/42").params == {"x": 42}
+    assert router.match("/foo/bar") is None
+
+
+def test_unknown_routing_engine():
+    with pytest.raises(AssertionError):
+        Router(engine="foo")
+
+
+def test_routing_engine_on_api():
+    api = API(routing_engine="regex")
+
+    @api.route("/greet/{person}")
+    async def greet(req, res, person):
+        res.text = person
+
+    assert api.client.get("/greet/John").text == "John"
+
+
+@pytest.mark.parametrize(
+    "pattern, kwargs, expected",
+    [
+        ("/about", {}, "/about"),
+        ("/posts/{pk:d}", {"pk": 42}, "/posts/42"),
+        ("/posts/{pk:03d}", {"pk": 7}, "/posts/007"),
+        ("/users/{name:w}", {"name": "john"}, "/users/john"),
+        ("/users/{name}/{pk:d}", {"name": "é", "pk": 1}, "/users/%C3%A9/1"),
+        ("/{{literal}}/{x}", {"x": "y"}, "/{literal}/y"),
+    ],
+)
+def test_route_pattern_url(pattern, kwargs, expected):
+    assert RoutePattern(pattern).url(**kwargs) == expected
@@ -1,6 +1,7 @@
 import pytest
 
 from bocadillo import API
+from bocadillo.exceptions import HTTPError
 from bocadillo.routing import RouteDeclarationError
 from tests.utils import RouteBuilder
 
@@ -67,3 +68,57 @@ def test_if_get_in_function_view_methods_then_head_mapped(api: API):
         pass
 
     assert api.client.head("/").status_code == 200
+
+
+def test_if_method_not_allowed_then_allow_header_is_set(api: API):
+    @api.route("/", methods=["post", "get"])
+    async def index(req, res):
+        pass
+
+    response = api.client.put("/")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET, HEAD, POST"
+
+
+def test_allow_header_on_class_based_views(api: API):
+    @api.route("/")
+    class Index:
+        async def get(self, req, res):
+            pass
+
+        async def delete(self, req, res):
+            pass
+
+    response = api.client.options("/")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET, HEAD, DELETE"
+
+
+def test_if_method_not_allowed_then_http_error_handler_is_used(api: API):
+    @api.error_handler(HTTPError)
+    def handle(req, res, exc: HTTPError):
+        res.status_code = exc.status_code
+        res.media = {"status": exc.status_code}
+
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    response = api.client.post("/")
+    assert response.status_code == 405
+    assert response.json() == {"status": 405}
+
+
+def test_if_method_not_allowed_and_handler_sets_no_status_then_500(api: API):
+    @api.error_handler(HTTPError)
+    def handle(req, res, exc: HTTPError):
+        res.media = {"status": exc.status_code}
+
+    @api.route("/")
+    async def index(req, res):
+        pass
+
+    response = api.client.post("/")
+    assert response.status_code == 500
+    assert response.json() == {"status": 405}
+    assert api.client.get("/missing").status_code == 500
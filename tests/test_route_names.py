@@ -61,3 +61,21 @@ def test_use_namespace(api: API):
 
     url = api.url_for("blog:about")
     assert url == "/about"
+
+
+def test_url_for_quotes_parameters(api: API):
+    @api.route("/about/{who}")
+    async def about(req, res, who):
+        pass
+
+    assert api.url_for("about", who="John Doe") == "/about/John%20Doe"
+    assert api.url_for("about", who="a?b#c") == "/about/a%3Fb%23c"
+    assert api.url_for("about", who="a/b") == "/about/a/b"
+
+
+def test_url_for_route_without_parameters_ignores_extra_kwargs(api: API):
+    @api.route("/about")
+    async def about(req, res):
+        pass
+
+    assert api.url_for("about", who="me") == "/about"
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from bocadillo import API
+from tests.utils import asgi_request, make_scope
+
+
+@pytest.fixture
+def single_flight_api(api: API, calls):
+    @api.route("/", single_flight=True)
+    async def index(req, res):
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        res.headers["x-call"] = str(len(calls))
+        res.text = "hello"
+
+    return api
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_response(single_flight_api, calls):
+    responses = await asyncio.gather(
+        *(asgi_request(single_flight_api, make_scope()) for _ in range(10))
+    )
+    assert len(calls) == 1
+    assert all(response["body"] == b"hello" for response in responses)
+    assert all(response["status"] == 200 for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_sequential_requests_are_not_shared(single_flight_api, calls):
+    await asgi_request(single_flight_api, make_scope())
+    await asgi_request(single_flight_api, make_scope())
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default(api: API, calls):
+    @api.route("/")
+    async def index(req, res):
+        calls.append(None)
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(asgi_request(api, make_scope()) for _ in range(3)))
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_different_cookies_are_not_shared(single_flight_api, calls):
+    await asyncio.gather(
+        asgi_request(
+            single_flight_api, make_scope(headers=[(b"cookie", b"a=1")])
+        ),
+        asgi_request(
+            single_flight_api, make_scope(headers=[(b"cookie", b"a=2")])
+        ),
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_vary(api: API, calls):
+    @api.route("/", single_flight=True)
+    async def index(req, res):
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        res.headers["vary"] = "accept-language"
+        res.text = req.headers.get("accept-language")
+
+    responses = await asyncio.gather(
+        *(
+            asgi_request(
+                api, make_scope(headers=[(b"accept-language", language)])
+            )
+            for language in (b"fr", b"fr", b"de")
+        )
+    )
+    assert [response["body"] for response in responses] == [b"fr", b"fr", b"de"]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_time_out(calls):
+    api = API(single_flight_timeout=0.01)
+
+    @api.route("/", single_flight=True)
+    async def index(req, res):
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        res.text = "hello"
+
+    responses = await asyncio.gather(
+        *(asgi_request(api, make_scope()) for _ in range(3))
+    )
+    assert len(calls) == 3
+    assert all(response["body"] == b"hello" for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_shared(api: API, calls):
+    @api.route("/", single_flight=True)
+    async def index(req, res):
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError
+        res.text = "hello"
+
+    @api.error_handler(ValueError)
+    def on_value_error(req, res, exc):
+        res.status_code = 503
+
+    first, second = await asyncio.gather(
+        asgi_request(api, make_scope()), asgi_request(api, make_scope())
+    )
+    assert first["status"] == 503
+    assert second["body"] == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_shared_headers_are_copied(api: API):
+    @api.route("/", single_flight=True)
+    async def index(req, res):
+        await asyncio.sleep(0.01)
+        res.text = "hello"
+
+    class AddHeader:
+        def __init__(self, dispatch):
+            self.dispatch = dispatch
+
+        async def __call__(self, req):
+            res = await self.dispatch(req)
+            res.headers.add("x-seen", "1")
+            return res
+
+    api.add_middleware(AddHeader)
+    responses = await asyncio.gather(
+        *(asgi_request(api, make_scope()) for _ in range(3))
+    )
+    for response in responses:
+        assert response["headers"].count((b"x-seen", b"1")) == 1
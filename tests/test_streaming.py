@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+from bocadillo import API, Executor, Middleware
+from tests.utils import empty_receive, make_scope
+
+
+def test_stream_async_generator(api: API):
+    @api.route("/")
+    async def index(req, res):
+        @res.stream
+        async def numbers():
+            for i in range(3):
+                yield str(i)
+
+    response = api.client.get("/")
+    assert response.status_code == 200
+    assert response.text == "012"
+    assert response.headers["content-type"] == "text/plain"
+    assert "content-length" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "source",
+    [[b"foo", "bar"], iter([b"foo", "bar"]), (c for c in ["foo", b"bar"])],
+)
+def test_stream_sync_iterables(api: API, source):
+    @api.route("/")
+    async def index(req, res):
+        res.stream(source)
+
+    assert api.client.get("/").text == "foobar"
+
+
+def test_sync_iterables_are_produced_in_executor():
+    api = API(executor=Executor(name="pool"))
+
+    @api.route("/")
+    async def index(req, res):
+        @res.stream
+        def threads():
+            for _ in range(3):
+                yield threading.current_thread().name + ","
+
+    names = api.client.get("/").text.rstrip(",").split(",")
+    assert len(names) == 3
+    assert all(name.startswith("pool") for name in names)
+
+
+def test_stream_generator_function_with_arguments(api: API):
+    @api.route("/")
+    async def index(req, res):
+        async def repeat(text, times):
+            for _ in range(times):
+                yield text
+
+        res.stream(repeat, "ab", times=3)
+
+    assert api.client.get("/").text == "ababab"
+
+
+def test_custom_content_type_and_status_code(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.status_code = 201
+        res.headers["content-type"] = "text/csv"
+        res.stream(["a,b\n", "1,2\n"])
+
+    response = api.client.get("/")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "text/csv"
+    assert response.text == "a,b\n1,2\n"
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_sent_as_they_are_produced(api: API):
+    produced = []
+    sent = []
+
+    @api.route("/")
+    async def index(req, res):
+        @res.stream
+        async def chunks():
+            for i in range(3):
+                produced.append(i)
+                yield str(i)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            sent.append((message["body"], list(produced)))
+
+    await api(make_scope())(empty_receive, send)
+    assert sent == [
+        (b"0", [0]),
+        (b"1", [0, 1]),
+        (b"2", [0, 1, 2]),
+        (b"", [0, 1, 2]),
+    ]
+
+
+def test_setting_content_after_stream(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.stream(["foo"])
+        res.text = "bar"
+
+    assert api.client.get("/").text == "bar"
+
+
+def test_stream_with_hooks_middleware_and_background(api: API):
+    events = []
+
+    def before(req, res, params):
+        events.append("before")
+
+    def after(req, res, params):
+        events.append("after")
+
+    class RecordMiddleware(Middleware):
+        def after_dispatch(self, req, res):
+            events.append("middleware")
+
+    api.add_middleware(RecordMiddleware)
+
+    @api.before(before)
+    @api.after(after)
+    @api.route("/")
+    async def index(req, res):
+        @res.stream
+        async def body():
+            events.append("stream")
+            yield "foo"
+
+        @res.background
+        async def task():
+            events.append("background")
+
+    assert api.client.get("/").text == "foo"
+    assert events == ["before", "after", "middleware", "stream", "background"]
+
+
+def test_stream_with_gzip():
+    api = API(enable_gzip=True, gzip_min_size=0)
+
+    @api.route("/")
+    async def index(req, res):
+        res.stream("foo" for _ in range(1000))
+
+    response = api.client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "foo" * 1000
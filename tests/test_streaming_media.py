@@ -0,0 +1,136 @@
+import json
+import math
+import threading
+
+import pytest
+
+from bocadillo import API, Executor, Media
+from bocadillo.media import STREAM_BATCH_SIZE
+
+
+def rows(n):
+    for i in range(n):
+        yield {"id": i}
+
+
+async def async_rows(n):
+    for i in range(n):
+        yield {"id": i}
+
+
+@pytest.mark.parametrize("make_rows", [rows, async_rows])
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_stream_json_array(api: API, make_rows, n):
+    @api.route("/")
+    async def index(req, res):
+        res.media = make_rows(n)
+
+    response = api.client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == Media.JSON
+    assert "content-length" not in response.headers
+    assert response.json() == [{"id": i} for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_stream_ndjson(api: API, n):
+    api.media_type = Media.NDJSON
+
+    @api.route("/")
+    async def index(req, res):
+        res.media = async_rows(n)
+
+    response = api.client.get("/")
+    assert response.headers["content-type"] == Media.NDJSON
+    lines = response.text.splitlines(keepends=True)
+    assert all(line.endswith("\n") for line in lines)
+    assert [json.loads(line) for line in lines] == [{"id": i} for i in range(n)]
+
+
+def test_ndjson_without_streaming(api: API):
+    api.media_type = Media.NDJSON
+
+    @api.route("/")
+    async def index(req, res):
+        res.media = [{"id": 0}, {"id": 1}]
+
+    response = api.client.get("/")
+    assert response.headers["content-length"] == str(len(response.content))
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"id": 0},
+        {"id": 1},
+    ]
+
+
+def test_lists_are_not_streamed(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.media = [1, 2, 3]
+
+    response = api.client.get("/")
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_stream_other_media_types(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.text = (str(i) for i in range(3))
+
+    response = api.client.get("/")
+    assert response.headers["content-type"] == Media.PLAIN_TEXT
+    assert response.text == "012"
+
+
+def test_last_setter_wins(api: API):
+    @api.route("/")
+    async def index(req, res):
+        res.media = rows(3)
+        res.text = "foo"
+
+    assert api.client.get("/").text == "foo"
+
+
+@pytest.mark.asyncio
+async def test_stream_is_sent_in_chunks():
+    media = Media(media_type=Media.JSON)
+    chunks = [
+        chunk
+        async for chunk in media.serialize_stream(
+            rows(1000), media_type=Media.JSON, chunk_size=1024
+        )
+    ]
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks)) == list(rows(1000))
+
+
+def test_stream_and_gzip():
+    api = API(enable_gzip=True, gzip_min_size=0)
+
+    @api.route("/")
+    async def index(req, res):
+        res.media = rows(100)
+
+    response = api.client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == list(rows(100))
+
+
+def test_sync_iterators_are_fetched_in_executor_in_batches():
+    api = API(executor=Executor(name="pool"))
+    threads = set()
+    n = 1000
+
+    def fetch_rows():
+        for i in range(n):
+            threads.add(threading.current_thread().name)
+            yield {"id": i}
+
+    @api.route("/")
+    async def index(req, res):
+        res.media = fetch_rows()
+
+    response = api.client.get("/")
+    assert response.json() == [{"id": i} for i in range(n)]
+    assert all(name.startswith("pool") for name in threads)
+    assert api.executor.metrics().completed == math.ceil(n / STREAM_BATCH_SIZE)
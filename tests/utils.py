@@ -1,6 +1,6 @@
 import os
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, List, Tuple
 
 from bocadillo import API
 
@@ -99,3 +99,41 @@ def env(var: str, value: str):
         os.environ.pop(var)
         if initial is not None:
             os.environ[var] = initial
+
+
+def make_scope(
+    path: str = "/", headers: List[Tuple[bytes, bytes]] = None, **kwargs
+) -> dict:
+    """Build the ASGI scope of a `GET` request."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+        **kwargs,
+    }
+
+
+async def empty_receive() -> dict:
+    """ASGI `receive` callable of a request without a body."""
+    return {"type": "http.request", "body": b""}
+
+
+async def asgi_request(api: API, scope: dict) -> dict:
+    """Call an app with an ASGI scope and collect the response.
+
+    Unlike the test client, this can be used to send concurrent requests
+    from an async test.
+    """
+    response = {"body": b""}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = message["headers"]
+        else:
+            response["body"] += message.get("body", b"")
+
+    await api(scope)(empty_receive, send)
+    return response